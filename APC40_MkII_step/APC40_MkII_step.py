@@ -6,7 +6,7 @@
 # Size of source mod 2**32: 17978 bytes
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import range
-from functools import partial
+from types import MappingProxyType
 from _Framework.ButtonMatrixElement import ButtonMatrixElement
 from _Framework.ClipCreator import ClipCreator
 from _Framework.ComboElement import ComboElement, DoublePressElement, MultiElement
@@ -32,15 +32,48 @@ from .TransportComponent import TransportComponent
 from .StepSequencer import StepSequencer
 NUM_TRACKS = 8
 NUM_SCENES = 5
+# Note numbers per scene row of the clip matrix (scene 0 is the top row)
+_MATRIX_IDS = tuple(tuple(32 + track - NUM_TRACKS * scene for track in range(NUM_TRACKS)) for scene in range(NUM_SCENES))
+# (encoder CC, LED ring CC) pairs
+_MIXER_ENCODER_IDS = tuple((48 + track, 56 + track) for track in range(NUM_TRACKS))
+_DEVICE_ENCODER_IDS = tuple((16 + index, 24 + index) for index in range(8))
+_clip_color_table = dict(Colors.LIVE_COLORS_TO_MIDI_VALUES)
+_clip_color_table[16777215] = 119
+_CLIP_COLOR_TABLE = MappingProxyType(_clip_color_table)
+del _clip_color_table
 
 class APC40_MkII_step(APC):
 
+    # The base ControlSurface keeps its __dict__; these cover the attributes set here
+    __slots__ = (
+        '_arm_buttons', '_bank_button', '_bank_toggle', '_clip_device_button', '_color_skin',
+        '_crossfade_button_skin', '_crossfade_buttons', '_crossfader_control', '_default_skin',
+        '_detail_view_button', '_device', '_device_bank_buttons', '_device_control_buttons_raw',
+        '_device_controls', '_device_controls_raw', '_device_layer_full', '_device_lock_button',
+        '_device_next_bank_button', '_device_on_off_button', '_device_prev_bank_button',
+        '_down_button', '_encoder_mode', '_foot_pedal_button', '_left_button',
+        '_master_select_button', '_master_volume_control', '_matrix_flat', '_matrix_rows_raw',
+        '_metronome_button', '_midi_map_dirty', '_mixer', '_mixer_encoders', '_mixer_layer_full',
+        '_mixer_layer_noselect', '_mute_buttons', '_next_device_button', '_nudge_down_button',
+        '_nudge_up_button', '_pan_button', '_pending_mode', '_play_button', '_prehear_control',
+        '_prev_device_button', '_quantization_buttons', '_quantization_selection',
+        '_raw_mode_handlers', '_raw_select_buttons', '_record_button', '_restore_ops',
+        '_right_button', '_saved_highlighting_session', '_scene_launch_buttons',
+        '_scene_launch_buttons_raw', '_select_buttons', '_send_select_buttons', '_sends_button',
+        '_sequencer', '_sequencer_active', '_session', '_session_matrix', '_session_record_button',
+        '_session_recording', '_session_zoom', '_shift_button', '_shift_combo_cache',
+        '_shifted_matrix', '_shifted_scene_buttons', '_solo_buttons', '_stop_all_button',
+        '_stop_button_skin', '_stop_buttons', '_stop_buttons_raw', '_tap_tempo_button',
+        '_tempo_control', '_transport', '_up_button', '_user_button', '_view_control',
+        '_volume_controls',)
+
     def __init__(self, *a, **k):
         (super(APC40_MkII_step, self).__init__)(*a, **k)
         self._color_skin = make_rgb_skin()
         self._default_skin = make_default_skin()
         self._stop_button_skin = make_stop_button_skin()
         self._crossfade_button_skin = make_crossfade_button_skin()
+        self._shift_combo_cache = {}
         with self.component_guard():
             self._create_controls()
             self._create_bank_toggle()
@@ -66,7 +99,7 @@ class APC40_MkII_step(APC):
             up_button=self._up_button,
             down_button=self._down_button,
             scene_launch_buttons_raw=self._scene_launch_buttons_raw,
-            clip_stop_buttons_raw=[btn for btn in self._stop_buttons],
+            clip_stop_buttons_raw=self._stop_buttons_raw,
             matrix_rows_raw=self._matrix_rows_raw,
             knob_controls=self._mixer_encoders,
             track_select_buttons=self._raw_select_buttons,
@@ -76,34 +109,53 @@ class APC40_MkII_step(APC):
             stop_all_button=self._stop_all_button,
             master_button=self._master_select_button,
         )
-        # hook mode buttons for sequencer control
-        try:
-            self._user_button.add_value_listener(self._on_user_button)
-            self._pan_button.add_value_listener(self._on_exit_to_normal)
-            self._sends_button.add_value_listener(self._on_exit_to_normal)
-        except Exception:
-            pass
+        # mode buttons for sequencer control, dispatched by note number in handle_nonsysex
+        self._raw_mode_handlers = {
+            89: self._on_user_button,
+            87: self._on_exit_to_normal,
+            88: self._on_exit_to_normal,
+        }
 
         self._sequencer_active = False
-        self._saved_session_matrix_buttons = None
-        self._saved_session_scene_buttons = None
+        self._pending_mode = None
+        self._midi_map_dirty = False
         self._saved_highlighting_session = self._session
+        self._device_layer_full = self._device.layer
+        # Reverse of the sequencer-mode setup, applied in order by _exit_sequencer_mode
+        self._restore_ops = (
+            (self._session.set_enabled, lambda: True),
+            (self._session_zoom.set_enabled, lambda: True),
+            (self.set_highlighting_session_component, lambda: self._saved_highlighting_session),
+            (self._device.set_enabled, lambda: True),
+            (self._device.set_parameter_controls, lambda: self._device_controls),
+            (lambda layer: setattr(self._device, "layer", layer), lambda: self._device_layer_full),
+            (lambda layer: setattr(self._mixer, "layer", layer), lambda: self._mixer_layer_full),
+        )
 
     def _with_shift(self, button):
-        return ComboElement(button, modifiers=[self._shift_button])
+        # One ComboElement per underlying button, so Shift has a single listener per pair
+        combo = self._shift_combo_cache.get(id(button))
+        if combo is None:
+            combo = ComboElement(button, modifiers=[self._shift_button])
+            self._shift_combo_cache[id(button)] = combo
+        return combo
 
     def _create_controls(self):
-        make_on_off_button = partial(make_button, skin=(self._default_skin))
+        default_skin = self._default_skin
+        color_skin = self._color_skin
+
+        def make_on_off_button(channel, identifier, **k):
+            return make_button(channel, identifier, skin=default_skin, **k)
 
         def make_color_button(channel, identifier, **k):
-            button = make_button(channel, identifier, skin=self._color_skin, **k)
+            button = make_button(channel, identifier, skin=color_skin, **k)
             button.is_rgb = True
             button.num_delayed_messages = 2
             return button
 
         def make_matrix_button(track, scene):
             return make_color_button(0,
-              (32 + track - NUM_TRACKS * scene),
+              (_MATRIX_IDS[scene][track]),
               name=("%d_Clip_%d_Button" % (track, scene)))
 
         def make_stop_button(track):
@@ -117,26 +169,28 @@ class APC40_MkII_step(APC):
         self._right_button = make_button(0, 96, name="Bank_Select_Right_Button")
         self._up_button = make_button(0, 94, name="Bank_Select_Up_Button")
         self._down_button = make_button(0, 95, name="Bank_Select_Down_Button")
-        self._stop_buttons = ButtonMatrixElement(rows=[
-         [make_stop_button(track) for track in range(NUM_TRACKS)]])
+        self._stop_buttons_raw = tuple(make_stop_button(track) for track in range(NUM_TRACKS))
+        self._stop_buttons = ButtonMatrixElement(rows=[self._stop_buttons_raw])
         self._stop_all_button = make_button(0, 81, name="Stop_All_Clips_Button")
-        self._scene_launch_buttons_raw = [make_color_button(0, (scene + 82), name=("Scene_%d_Launch_Button" % scene)) for scene in range(NUM_SCENES)]
+        self._scene_launch_buttons_raw = tuple(make_color_button(0, (scene + 82), name=("Scene_%d_Launch_Button" % scene)) for scene in range(NUM_SCENES))
         self._scene_launch_buttons = ButtonMatrixElement(rows=[
          self._scene_launch_buttons_raw])
-        self._matrix_rows_raw = [[make_matrix_button(track, scene) for track in range(NUM_TRACKS)] for scene in range(NUM_SCENES)]
+        self._matrix_flat = tuple(make_matrix_button(track, scene) for scene in range(NUM_SCENES) for track in range(NUM_TRACKS))
+        # rows stay lists: recursive_map only descends into the outer sequence type
+        self._matrix_rows_raw = [list(self._matrix_flat[scene * NUM_TRACKS:(scene + 1) * NUM_TRACKS]) for scene in range(NUM_SCENES)]
         self._session_matrix = ButtonMatrixElement(rows=(self._matrix_rows_raw))
         self._pan_button = make_on_off_button(0, 87, name="Pan_Button")
         self._sends_button = make_on_off_button(0,
           88, name="Sends_Button", resource_type=PrioritizedResource)
         self._user_button = make_on_off_button(0, 89, name="User_Button")
         self._mixer_encoders = ButtonMatrixElement(rows=[
-         [make_ring_encoder((48 + track), (56 + track), name=("Track_Control_%d" % track)) for track in range(NUM_TRACKS)]])
+         [make_ring_encoder(encoder_id, ring_id, name=("Track_Control_%d" % track)) for track, (encoder_id, ring_id) in enumerate(_MIXER_ENCODER_IDS)]])
         self._volume_controls = ButtonMatrixElement(rows=[
          [make_slider(track, 7, name=("%d_Volume_Control" % track)) for track in range(NUM_TRACKS)]])
         self._master_volume_control = make_slider(0, 14, name="Master_Volume_Control")
         self._prehear_control = make_encoder(0, 47, name="Prehear_Volume_Control")
         self._crossfader_control = make_slider(0, 15, name="Crossfader")
-        self._raw_select_buttons = [make_on_off_button(channel, 51, name=("%d_Select_Button" % channel)) for channel in range(NUM_TRACKS)]
+        self._raw_select_buttons = tuple(make_on_off_button(channel, 51, name=("%d_Select_Button" % channel)) for channel in range(NUM_TRACKS))
         self._arm_buttons = ButtonMatrixElement(rows=[
          [make_on_off_button(channel, 48, name=("%d_Arm_Button" % channel)) for channel in range(NUM_TRACKS)]])
         self._solo_buttons = ButtonMatrixElement(rows=[
@@ -162,9 +216,9 @@ class APC40_MkII_step(APC):
         self._nudge_up_button = make_button(0, 101, name="Nudge_Up_Button")
         self._tap_tempo_button = make_button(0, 99, name="Tap_Tempo_Button")
         self._tempo_control = make_encoder(0, 13, name="Tempo_Control")
-        self._device_controls_raw = [make_ring_encoder((16 + index), (24 + index), name=("Device_Control_%d" % index)) for index in range(8)]
+        self._device_controls_raw = tuple(make_ring_encoder(encoder_id, ring_id, name=("Device_Control_%d" % index)) for index, (encoder_id, ring_id) in enumerate(_DEVICE_ENCODER_IDS))
         self._device_controls = ButtonMatrixElement(rows=[self._device_controls_raw])
-        self._device_control_buttons_raw = [make_on_off_button(0, 58 + index) for index in range(8)]
+        self._device_control_buttons_raw = tuple(make_on_off_button(0, 58 + index) for index in range(8))
         self._device_bank_buttons = ButtonMatrixElement(rows=[
          [DeviceBankButtonElement(button, modifiers=[self._shift_button]) for button in self._device_control_buttons_raw]])
         self._device_prev_bank_button = self._device_control_buttons_raw[2]
@@ -217,9 +271,7 @@ class APC40_MkII_step(APC):
           stop_all_clips_button=(self._stop_all_button),
           scene_launch_buttons=(self._scene_launch_buttons),
           clip_launch_buttons=(self._session_matrix)))
-        clip_color_table = Colors.LIVE_COLORS_TO_MIDI_VALUES.copy()
-        clip_color_table[16777215] = 119
-        self._session.set_rgb_mode(clip_color_table, Colors.RGB_COLOR_TABLE)
+        self._session.set_rgb_mode(_CLIP_COLOR_TABLE, Colors.RGB_COLOR_TABLE)
         self._session_zoom = SessionZoomingComponent((self._session),
           name="Session_Overview",
           enable_skinning=True,
@@ -245,6 +297,16 @@ class APC40_MkII_step(APC):
           prehear_volume_control=(self._prehear_control),
           crossfader_control=(self._crossfader_control),
           crossfade_buttons=(self._crossfade_buttons)))
+        # Sequencer mode swaps in this layer so the select buttons are free for note length
+        self._mixer_layer_full = self._mixer.layer
+        self._mixer_layer_noselect = Layer(volume_controls=(self._volume_controls),
+          arm_buttons=(self._arm_buttons),
+          solo_buttons=(self._solo_buttons),
+          mute_buttons=(self._mute_buttons),
+          shift_button=(self._shift_button),
+          prehear_volume_control=(self._prehear_control),
+          crossfader_control=(self._crossfader_control),
+          crossfade_buttons=(self._crossfade_buttons))
         self._mixer.master_strip().layer = Layer(volume_control=(self._master_volume_control),
           select_button=(self._master_select_button))
         self._encoder_mode = ModesComponent(name="Encoder_Mode", is_enabled=False)
@@ -303,83 +365,40 @@ class APC40_MkII_step(APC):
         if self._sequencer_active:
             return
         self._sequencer_active = True
-        # Physically remove button assignments from Session to stop clip launching
         try:
+            # Disabling Session releases its layer, which unbinds the clip, scene, stop,
+            # Stop All and bank buttons in one pass so StepSequencer can use them
             if hasattr(self, "_session"):
-                # Store original button assignments for restoration
-                self._saved_session_matrix_buttons = self._session_matrix
-                self._saved_session_scene_buttons = self._scene_launch_buttons
-                # Remove all button bindings from Session
-                self._session.set_clip_launch_buttons(None)
-                self._session.set_scene_launch_buttons(None)
-                # CRITICAL: Remove stop_all_clips_button so StepSequencer can use it
-                self._session.set_stop_all_clips_button(None)
-                self.log_message("Stop All button removed from Session component")
                 self._session.set_enabled(False)
+                self.log_message("Session layer released (clip/scene/Stop All buttons unbound)")
             if hasattr(self, "_session_zoom"):
                 self._session_zoom.set_enabled(False)
             self.set_highlighting_session_component(None)
-        except Exception:
-            pass
-        try:
-            # clear session lights on grid
-            self._sequencer._clear_all_leds()
-        except Exception:
-            pass
-        # Temporarily disable Device parameter mapping so device encoders are free for sequencer
-        try:
+            # Temporarily disable Device parameter mapping so device encoders are free for sequencer
             if hasattr(self, "_device"):
                 # fully disable device component and release encoders
                 self._device.set_enabled(False)
                 self._device.set_parameter_controls(None)
                 # also clear layer bindings temporarily
-                try:
-                    self._saved_device_layer = getattr(self._device, 'layer', None)
-                except Exception:
-                    self._saved_device_layer = None
-                try:
-                    from _Framework.Layer import Layer as _TmpLayer
-                    self._device.layer = _TmpLayer()
-                except Exception:
-                    pass
+                self._device.layer = Layer()
                 # ensure Live rebuilds MIDI map to drop any forwarding
-                self.request_rebuild_midi_map()
-        except Exception:
-            pass
-        # Temporarily remove Mixer track selection so select buttons can be used for note length
-        try:
+                self._midi_map_dirty = True
+            # Temporarily remove Mixer track selection so select buttons can be used for note length
             if hasattr(self, "_mixer"):
-                # Save original mixer layer and clear track_select_buttons binding
-                from _Framework.Layer import Layer as _Layer
-                self._saved_mixer_layer = getattr(self._mixer, 'layer', None)
-                # Build a layer identical to current but without track_select_buttons
-                self._mixer.layer = _Layer(volume_controls=(self._volume_controls),
-                                           arm_buttons=(self._arm_buttons),
-                                           solo_buttons=(self._solo_buttons),
-                                           mute_buttons=(self._mute_buttons),
-                                           shift_button=(self._shift_button),
-                                           prehear_volume_control=(self._prehear_control),
-                                           crossfader_control=(self._crossfader_control),
-                                           crossfade_buttons=(self._crossfade_buttons))
-        except Exception:
-            pass
-        try:
-            self._sequencer._enter()
+                self._mixer.layer = self._mixer_layer_noselect
+                self._midi_map_dirty = True
         except Exception as e:
-            try:
-                self.log_message("Sequencer enter error: " + str(e))
-            except Exception:
-                pass
+            self.log_message("Sequencer mode setup error: " + str(e))
+        finally:
+            self._flush_midi_map_rebuild()
         try:
+            self._sequencer._enter()
             # Refresh grid to show existing notes
             self.log_message("About to call _refresh_grid()")
             self._sequencer._refresh_grid()
             self.log_message("_refresh_grid() completed")
         except Exception as e:
-            try:
-                self.log_message("Grid refresh error: " + str(e))
-            except Exception:
-                pass
+            self.log_message("Sequencer enter error: " + str(e))
 
     def _exit_sequencer_mode(self):
         if not self._sequencer_active:
@@ -387,58 +406,61 @@ class APC40_MkII_step(APC):
         self._sequencer_active = False
         try:
             self._sequencer._exit()
-        except Exception:
-            pass
-        # Restore Session button assignments and re-enable
-        try:
-            if hasattr(self, "_session"):
-                # Restore button bindings
-                if self._saved_session_matrix_buttons is not None:
-                    self._session.set_clip_launch_buttons(self._saved_session_matrix_buttons)
-                if self._saved_session_scene_buttons is not None:
-                    self._session.set_scene_launch_buttons(self._saved_session_scene_buttons)
-                # Restore stop_all_clips_button to Session
-                self._session.set_stop_all_clips_button(self._stop_all_button)
-                self.log_message("Stop All button restored to Session component")
-                self._session.set_enabled(True)
-            if hasattr(self, "_session_zoom"):
-                self._session_zoom.set_enabled(True)
-            self.set_highlighting_session_component(self._saved_highlighting_session)
-        except Exception:
-            pass
-        # Re-enable Device parameter mapping
-        try:
-            if hasattr(self, "_device") and hasattr(self, "_device_controls"):
-                self._device.set_enabled(True)
-                self._device.set_parameter_controls(self._device_controls)
-                # restore original device layer if saved
-                try:
-                    if hasattr(self, '_saved_device_layer') and self._saved_device_layer is not None:
-                        self._device.layer = self._saved_device_layer
-                except Exception:
-                    pass
-                # rebuild MIDI map to restore forwarding
-                self.request_rebuild_midi_map()
-        except Exception:
-            pass
-        # Restore Mixer track selection binding and rebuild map
+        except Exception as e:
+            self.log_message("Sequencer exit error: " + str(e))
         try:
-            if hasattr(self, "_mixer") and hasattr(self, '_saved_mixer_layer') and self._saved_mixer_layer is not None:
-                self._mixer.layer = self._saved_mixer_layer
-                self.request_rebuild_midi_map()
-        except Exception:
-            pass
+            # Restore Session, Device and Mixer bindings and rebuild map
+            for setter, getter in self._restore_ops:
+                setter(getter())
+            self.log_message("Session layer restored (clip/scene/Stop All buttons rebound)")
+            self._midi_map_dirty = True
+        except Exception as e:
+            self.log_message("Sequencer mode teardown error: " + str(e))
+        finally:
+            self._flush_midi_map_rebuild()
+
+    def _flush_midi_map_rebuild(self):
+        # Collapse the re-layer steps of a mode transition into one MIDI map rebuild
+        if self._midi_map_dirty:
+            self._midi_map_dirty = False
+            self.request_rebuild_midi_map()
+
+    def handle_nonsysex(self, midi_bytes):
+        # Note-on (channel 0) for User/Pan/Sends goes straight to the mode handlers. The
+        # message still continues to the forwarding registry for the Encoder_Mode layer.
+        if midi_bytes[0] == 0x90:
+            handler = self._raw_mode_handlers.get(midi_bytes[1])
+            if handler is not None:
+                handler(midi_bytes[2])
+        super(APC40_MkII_step, self).handle_nonsysex(midi_bytes)
 
     def _on_user_button(self, value):
         if not value:
             return
-        if not self._sequencer_active:
-            self._enter_sequencer_mode()
-        else:
-            self._exit_sequencer_mode()
+        # Toggle relative to any transition still queued, so rapid presses resolve correctly
+        current = self._pending_mode
+        if current is None:
+            current = "seq" if self._sequencer_active else "normal"
+        self._request_mode("normal" if current == "seq" else "seq")
 
     def _on_exit_to_normal(self, value):
         if value:
+            self._request_mode("normal")
+
+    def _request_mode(self, mode):
+        # Presses within one tick collapse into a single terminal transition
+        already_scheduled = self._pending_mode is not None
+        self._pending_mode = mode
+        if not already_scheduled:
+            self.schedule_message(1, self._apply_pending_mode)
+
+    def _apply_pending_mode(self):
+        mode = self._pending_mode
+        self._pending_mode = None
+        self.log_message("Applying queued mode transition: %s" % mode)
+        if mode == "seq":
+            self._enter_sequencer_mode()
+        elif mode == "normal":
             self._exit_sequencer_mode()
 
     def _create_recording(self):
@@ -452,7 +474,7 @@ class APC40_MkII_step(APC):
           _uses_foot_pedal=(self._foot_pedal_button)))
 
     def get_matrix_button(self, column, row):
-        return self._matrix_rows_raw[row][column]
+        return self._matrix_flat[row * NUM_TRACKS + column]
 
     def _product_model_id_byte(self):
         return 41
@@ -1,13 +1,46 @@
 from __future__ import absolute_import, print_function, unicode_literals
+from bisect import bisect_left
 import Live
 from .SequencerBase import SequencerBase
 
+# Sentinel for getattr probes where None could be a real attribute value
+_MISSING = object()
+
+# Waveform intensity thresholds; an intensity maps to the colour at bisect_left(bins, intensity)
+_INTENSITY_BINS = (0.1, 0.3, 0.5, 0.7, 0.9)
+
+
+class _AClipInfo(object):
+    """Properties of the detected audio clip, read on every grid refresh."""
+    __slots__ = ('length_beats', 'loop_start', 'loop_end', 'is_warped', 'channels', 'sample_rate', 'sample_length')
+
+    def __init__(self, length_beats, loop_start, loop_end, is_warped, channels, sample_rate, sample_length):
+        self.length_beats = length_beats
+        self.loop_start = loop_start
+        self.loop_end = loop_end
+        self.is_warped = is_warped
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.sample_length = sample_length
+
 class ClipSequencer(SequencerBase):
     """
     Audio clip sequencer functionality.
     Handles audio clip detection, waveform visualization, and audio-specific controls.
     """
     
+    # Zoom pages per view mode: 0=full, 1-4 = 1/2/4/8 bars, 5-7 = 1/2, 1/4, 1/8
+    _ZOOM_TABLE = {0: 1, 1: 1, 2: 2, 3: 4, 4: 8, 5: 0.5, 6: 0.25, 7: 0.125}
+    
+    # Linear gain for the dB steps offered by set_gain
+    _GAIN_LUT = {gain_db: pow(10.0, gain_db / 20.0) for gain_db in (-12, -6, 0, 3, 6)}
+    
+    # Waveform colour cache entries kept before the oldest is evicted
+    _COLOR_CACHE_LIMIT = 32
+    
+    # Clip properties whose Live listeners redraw the waveform (warp_markers needs Live 11+)
+    _CLIP_WATCHED_PROPERTIES = ('loop_start', 'loop_end', 'warping', 'warp_markers')
+    
     def __init__(self, control_surface, song, logger=None):
         """
         Initialize the clip sequencer.
@@ -20,13 +53,39 @@ class ClipSequencer(SequencerBase):
         super(ClipSequencer, self).__init__(control_surface, song, logger)
         
         # Audio clip state
-        self._audio_clip_info = {}
+        self._audio_clip_info = None
         self._bank_mode = False  # ALT mode for extended controls
         self._view_mode = 0  # 0=full, 1-4=bars, 5-7=fractions
         self._zoom_pages = 1  # Number of pages for current view
+        self._beats_per_column = 0.0  # Loop length / (steps * zoom pages); see _recompute_beats_per_column
+        
+        self._last_clip = None  # Clip that _audio_clip_info was detected from (held, so its id can't be recycled)
+        
+        # Warp markers: sorted tuple of beat times (also used as-is in the colour cache key)
+        self._warp_markers = ()
+        
+        # Waveform row colours (left_colors, right_colors, warp_flags) per _color_cache_key;
+        # kept across enter/exit so returning to a clip view skips the rebuild
+        self._color_cache = {}
+        
+        # Latest cache key waiting for a deferred colour build; newer requests replace it
+        self._pending_color_key = None
+        self._last_matrix_rows = None  # Rows the last frame was drawn to, for redrawing once colours are ready
+        
+        # Colour per _INTENSITY_BINS bucket: off, light green, ideal, near edge, clipping
+        self._intensity_lut = (self._LED_OFF, self._LED_LIME, self._LED_GREEN,
+                               self._LED_YELLOW, self._LED_ORANGE, self._LED_RED)
         
-        # Warp markers
-        self._warp_markers = []
+        # Bumped by every state change that affects the grid; refresh_grid skips when already rendered
+        self._dirty_version = 0
+        self._rendered_version = -1
+        self._rendered_clip = None  # Clip the last written frame was drawn from
+        
+        # Clip whose loop / warp marker listeners are registered, so edits made in Live redraw
+        self._watched_clip = None
+        
+        # Clip the last refresh_grid resolved; a different clip re-detects and redraws
+        self._frame_clip = None
         
     # ==================== AUDIO CLIP DETECTION ====================
     
@@ -37,55 +96,55 @@ class ClipSequencer(SequencerBase):
         Returns:
             bool: True if audio clip detected
         """
+        clip = self._get_cached_clip()
+        if clip is None:
+            return False
+        
+        # Same clip as the last successful detection (StepSequencer mode detection runs just before enter())
+        if clip is self._last_clip and self._audio_clip_info is not None:
+            return True
+        
+        # Only the Live clip/sample property reads can raise here
         try:
-            clip = self._get_cached_clip()
-            if clip is None:
-                return False
-            
             # Check if it's an audio clip
-            is_audio = False
-            if hasattr(clip, 'is_audio_clip'):
-                is_audio = clip.is_audio_clip
-            else:
+            is_audio = getattr(clip, 'is_audio_clip', _MISSING)
+            if is_audio is _MISSING:
                 # Fallback: check for MIDI-specific properties
                 is_audio = not (hasattr(clip, 'get_notes') or hasattr(clip, 'get_notes_extended'))
             
             if not is_audio:
                 return False
             
-            # Extract audio clip info
-            self._audio_clip_info = {
-                'length_beats': float(clip.length),
-                'loop_start': float(clip.loop_start),
-                'loop_end': float(clip.loop_end),
-                'is_warped': bool(getattr(clip, 'warping', False)),
-                'channels': 2,  # Default to stereo
-                'sample_rate': 44100  # Default
-            }
-            
-            # Try to get sample info (may not be available for warped clips)
-            if hasattr(clip, 'sample'):
-                sample = clip.sample
-                if sample:
-                    if hasattr(sample, 'length'):
-                        self._audio_clip_info['sample_length'] = sample.length
-                    if hasattr(sample, 'sample_rate'):
-                        self._audio_clip_info['sample_rate'] = sample.sample_rate
-            
-            # Detect channels (stereo vs mono)
-            # Note: This is a simplified detection
-            self._audio_clip_info['channels'] = 2  # Assume stereo by default
-            
-            self._log_info("Audio clip detected: %.1f beats, %s, %d channels" % 
-                         (self._audio_clip_info['length_beats'],
-                          "warped" if self._audio_clip_info['is_warped'] else "unwarped",
-                          self._audio_clip_info['channels']))
-            
-            return True
-            
+            # Extract audio clip info (sample info may not be available for warped clips)
+            # Channels: simplified detection, assume stereo by default
+            sample = getattr(clip, 'sample', None)
+            info = _AClipInfo(
+                length_beats=float(clip.length),
+                loop_start=float(clip.loop_start),
+                loop_end=float(clip.loop_end),
+                is_warped=bool(getattr(clip, 'warping', False)),
+                channels=2,
+                sample_rate=getattr(sample, 'sample_rate', 44100) if sample else 44100,
+                sample_length=getattr(sample, 'length', None) if sample else None)
+            warp_markers = self._read_warp_markers(clip)
         except Exception as e:
             self._log_error("detect_audio_clip", e)
             return False
+        
+        self._audio_clip_info = info
+        self._warp_markers = warp_markers
+        self._last_clip = clip
+        if clip is not self._watched_clip:
+            self._watch_clip(clip)
+        self._recompute_beats_per_column()
+        self._dirty_version += 1
+        self._log_info("Audio clip detected: %.1f beats, %s, %d channels, %d warp markers" % 
+                     (info.length_beats,
+                      "warped" if info.is_warped else "unwarped",
+                      info.channels,
+                      len(warp_markers)))
+        
+        return True
     
     # ==================== GRID RENDERING ====================
     
@@ -96,56 +155,191 @@ class ClipSequencer(SequencerBase):
         Args:
             matrix_rows: The matrix button rows
         """
+        # Resolved every frame (memoised by slot) so selecting another clip slot is picked up
         clip = self._get_cached_clip()
-        if clip is None or not self._audio_clip_info:
+        if clip is not self._frame_clip:
+            self._frame_clip = clip
+            if clip is not None and (clip is not self._last_clip or self._audio_clip_info is None):
+                # Re-read loop range and warp markers; stays None if the new clip is not audio
+                self._audio_clip_info = None
+                if not self.detect_audio_clip():
+                    self._last_clip = None
+            self._dirty_version += 1
+        if clip is None or self._audio_clip_info is None:
             self._clear_all_leds(matrix_rows)
             return
         
+        # Nothing changed since the last frame was written from this clip
+        if self._rendered_version == self._dirty_version and clip is self._rendered_clip:
+            return
+        self._rendered_version = self._dirty_version
+        self._rendered_clip = clip
+        self._last_matrix_rows = matrix_rows
+        
+        # The pad writes (and a first-time colour cache build) are the only Live-facing calls
         try:
-            # Clear grid first
-            self._clear_all_leds(matrix_rows)
-            
-            # Calculate visible time range
-            loop_length = self._audio_clip_info['loop_end'] - self._audio_clip_info['loop_start']
-            beats_per_column = loop_length / (self._steps_per_page * self._zoom_pages)
-            
-            # Render waveform visualization
-            channels = self._audio_clip_info['channels']
+            self._refresh_grid_impl(clip, matrix_rows)
+        except Exception as e:
+            self._log_error("refresh_grid", e)
+    
+    def _refresh_grid_impl(self, clip, matrix_rows):
+        """
+        Compose the waveform frame for the current clip and write it to the pads.
+        
+        Args:
+            clip: The audio clip
+            matrix_rows: The matrix button rows
+        """
+        info = self._audio_clip_info
+        loop_start = info.loop_start
+        loop_end = info.loop_end
+        steps = self._steps_per_page
+        
+        beats_per_column = self._beats_per_column
+        
+        # Render waveform visualization (markers only until the deferred colour build lands)
+        stereo = info.channels == 2
+        colors = self._color_cache.get(self._color_cache_key(clip))
+        if colors is None:
+            self._request_color_cache(clip)
+            colors = self._loading_colors()
+        left_colors, right_colors, warp_flags = colors
+        
+        # Compose the whole grid row by row (unlit pads stay off), then write it as one LED frame
+        off = self._LED_OFF
+        times = [loop_start + col * beats_per_column for col in range(steps)]
+        # Columns at or past the loop end stay unlit; times ascend, so the lit columns are a prefix
+        visible = bisect_left(times, loop_end)
+        times = times[:visible]
+        blank = [off] * (steps - visible)
+        led_green = self._LED_GREEN
+        led_orange = self._LED_ORANGE
+        led_red = self._LED_RED
+        # Row 0: Loop START markers
+        start_row = [led_green if abs(t - loop_start) < 0.01 else off for t in times] + blank
+        # Row 2: Warp markers
+        warp_row = [led_orange if flag else off for flag in warp_flags[:visible]] + blank
+        # Row 4: Loop END markers
+        end_row = [led_red if abs(t - loop_end) < beats_per_column else off for t in times] + blank
+        # Rows 1/3: Left/right channel (stereo) or unused (mono)
+        if stereo:
+            left_row = list(left_colors[:visible]) + blank
+            right_row = list(right_colors[:visible]) + blank
+        else:
+            left_row = right_row = [off] * steps
+        frame = [start_row, left_row, warp_row, right_row, end_row]
+        frame.extend([off] * steps for _ in range(self._rows_visible - 5))
+        
+        self._flush_led_frame(frame, matrix_rows)
+    
+    def _build_color_cache(self, clip):
+        """
+        Precompute the waveform row colours for every visible column of the
+        current clip and view mode.
+        
+        Args:
+            clip: The audio clip
             
-            for col in range(self._steps_per_page):
-                # Calculate time position for this column
-                time_offset = col * beats_per_column
-                absolute_time = self._audio_clip_info['loop_start'] + time_offset
-                
-                if absolute_time >= self._audio_clip_info['loop_end']:
-                    continue
-                
-                # Row 0: Loop START markers
-                if self._is_loop_start_marker(absolute_time):
-                    self._set_pad_led_color(col, 0, self._LED_GREEN, matrix_rows)
-                
-                # Row 1: Left channel (stereo) or unused (mono)
-                if channels == 2:
-                    intensity = self._get_waveform_intensity(clip, absolute_time, 0)
-                    color = self._get_intensity_color(intensity)
-                    self._set_pad_led_color(col, 1, color, matrix_rows)
-                
-                # Row 2: Warp markers
-                if self._has_warp_marker(absolute_time, beats_per_column):
-                    self._set_pad_led_color(col, 2, self._LED_ORANGE, matrix_rows)
-                
-                # Row 3: Right channel (stereo) or unused (mono)
-                if channels == 2:
-                    intensity = self._get_waveform_intensity(clip, absolute_time, 1)
-                    color = self._get_intensity_color(intensity)
-                    self._set_pad_led_color(col, 3, color, matrix_rows)
-                
-                # Row 4: Loop END markers
-                if self._is_loop_end_marker(absolute_time, beats_per_column):
-                    self._set_pad_led_color(col, 4, self._LED_RED, matrix_rows)
+        Returns:
+            tuple: (left_colors, right_colors, warp_flags), one entry per column
+        """
+        loop_start = self._audio_clip_info.loop_start
+        beats_per_column = self._beats_per_column
+        lut = self._intensity_lut
+        intensity = self._get_waveform_intensity
+        left_colors = []
+        right_colors = []
+        for col in range(self._steps_per_page):
+            absolute_time = loop_start + col * beats_per_column
+            left_colors.append(lut[bisect_left(_INTENSITY_BINS, intensity(clip, absolute_time, 0))])
+            right_colors.append(lut[bisect_left(_INTENSITY_BINS, intensity(clip, absolute_time, 1))])
+        warp_flags = self._warp_marker_flags(loop_start, beats_per_column)
+        colors = (tuple(left_colors), tuple(right_colors), warp_flags)
+        cache = self._color_cache
+        if len(cache) >= self._COLOR_CACHE_LIMIT:
+            # Evict the oldest entry (dicts keep insertion order)
+            del cache[next(iter(cache))]
+        cache[self._color_cache_key(clip)] = colors
+        self._log_info("Waveform colour cache built for view mode %d" % self._view_mode)
+        return colors
+    
+    def _color_cache_key(self, clip):
+        """
+        Key the colour cache by what the colours are derived from, so entries
+        stay valid across loop edits, view changes and re-entering the mode.
+        
+        Args:
+            clip: The audio clip
             
+        Returns:
+            tuple: (sample file or clip id, loop start, loop end, view mode, warp markers)
+        """
+        info = self._audio_clip_info
+        source = getattr(clip, 'file_path', None) or id(clip)
+        return (source, info.loop_start, info.loop_end, self._view_mode, self._warp_markers)
+    
+    def _request_color_cache(self, clip):
+        """
+        Queue a colour cache build for the current clip and view mode on the
+        next scheduler tick, so MIDI handlers return without waiting on it.
+        
+        Args:
+            clip: The audio clip
+        """
+        key = self._color_cache_key(clip)
+        if key in self._color_cache:
+            return
+        scheduled = self._pending_color_key is not None
+        self._pending_color_key = key
+        if not scheduled:
+            self._cs.schedule_message(1, self._build_pending_color_cache)
+    
+    def _build_pending_color_cache(self):
+        """Scheduled: build the latest requested colour cache and redraw the grid."""
+        key = self._pending_color_key
+        self._pending_color_key = None
+        try:
+            if not self._mode or key is None or key in self._color_cache:
+                return
+            clip = self._get_cached_clip()
+            # Superseded by a clip or view change since the request; that change queued its own build
+            if clip is None or self._audio_clip_info is None or key != self._color_cache_key(clip):
+                return
+            self._build_color_cache(clip)
+            self._dirty_version += 1
+            matrix_rows = self._last_matrix_rows
+            if matrix_rows is not None:
+                self._begin_led_frame()
+                try:
+                    self.refresh_grid(matrix_rows)
+                finally:
+                    with self._cs.accumulating_midi_messages():
+                        self._end_led_frame(matrix_rows)
         except Exception as e:
-            self._log_error("refresh_grid", e)
+            self._log_error("_build_pending_color_cache", e)
+    
+    def _loading_colors(self):
+        """Placeholder row colours (waveform rows unlit, no warp markers) while the cache builds."""
+        blank = (self._LED_OFF,) * self._steps_per_page
+        return (blank, blank, (False,) * self._steps_per_page)
+    
+    def _recompute_beats_per_column(self):
+        """Update the cached column width after the view mode or loop range changed."""
+        info = self._audio_clip_info
+        if info is None:
+            self._beats_per_column = 0.0
+            return
+        loop_length = info.loop_end - info.loop_start
+        self._beats_per_column = loop_length / (self._steps_per_page * self._zoom_pages)
+    
+    def _mark_grid_dirty(self):
+        """Loop range, warp markers or clip changed; the next refresh_grid redraws."""
+        self._dirty_version += 1
+    
+    def _clear_all_leds(self, matrix_rows):
+        """Turn off all matrix pad LEDs; the next refresh_grid redraws the waveform."""
+        super(ClipSequencer, self)._clear_all_leds(matrix_rows)
+        self._dirty_version += 1
     
     def _get_waveform_intensity(self, clip, time, channel):
         """
@@ -174,33 +368,77 @@ class ClipSequencer(SequencerBase):
         Returns:
             int: LED color value
         """
-        if intensity > 0.9:
-            return self._LED_RED  # Clipping
-        elif intensity > 0.7:
-            return self._LED_ORANGE  # Near edge
-        elif intensity > 0.5:
-            return self._LED_YELLOW  # Near orange
-        elif intensity > 0.3:
-            return self._LED_GREEN  # Ideal level
-        elif intensity > 0.1:
-            return self._LED_LIME  # Light green
-        else:
-            return self._LED_OFF  # No intensity
+        return self._intensity_lut[bisect_left(_INTENSITY_BINS, intensity)]
+    
+    def _warp_marker_flags(self, loop_start, beats_per_column):
+        """
+        Flag the columns that have a warp marker within one column width.
+        Columns and markers are both ascending, so one merge pass covers them.
+        
+        Args:
+            loop_start: Beat time of column 0
+            beats_per_column: Column width in beats (also the match tolerance)
+            
+        Returns:
+            tuple: One bool per visible column
+        """
+        markers = self._warp_markers
+        count = len(markers)
+        flags = []
+        i = 0
+        for col in range(self._steps_per_page):
+            time = loop_start + col * beats_per_column
+            # Markers this far behind can't match this column or any later one
+            while i < count and time - markers[i] >= beats_per_column:
+                i += 1
+            flags.append(i < count and markers[i] - time < beats_per_column)
+        return tuple(flags)
     
-    def _is_loop_start_marker(self, time):
-        """Check if time is at loop start."""
-        return abs(time - self._audio_clip_info['loop_start']) < 0.01
+    def _watch_clip(self, clip):
+        """Move the loop / warp marker listeners to this clip (None just removes them)."""
+        previous = self._watched_clip
+        if previous is not None:
+            for name in self._CLIP_WATCHED_PROPERTIES:
+                try:
+                    has_listener = getattr(previous, name + '_has_listener', None)
+                    if has_listener is not None and has_listener(self._on_clip_loop_changed):
+                        getattr(previous, 'remove_' + name + '_listener')(self._on_clip_loop_changed)
+                except Exception:
+                    pass  # Clip may already be deleted
+        self._watched_clip = clip
+        if clip is None:
+            return
+        for name in self._CLIP_WATCHED_PROPERTIES:
+            add_listener = getattr(clip, 'add_' + name + '_listener', None)
+            if add_listener is None:
+                continue  # e.g. warp_markers before Live 11
+            try:
+                add_listener(self._on_clip_loop_changed)
+            except Exception as e:
+                self._log_error("_watch_clip", e)
     
-    def _is_loop_end_marker(self, time, beats_per_column):
-        """Check if time is at loop end."""
-        return abs(time - self._audio_clip_info['loop_end']) < beats_per_column
+    def _on_clip_loop_changed(self):
+        """Loop range, warping or warp markers were edited (here or in Live); re-read them and redraw."""
+        clip = self._watched_clip
+        info = self._audio_clip_info
+        if clip is None or info is None or clip is not self._last_clip:
+            return
+        try:
+            info.loop_start = float(clip.loop_start)
+            info.loop_end = float(clip.loop_end)
+            info.is_warped = bool(getattr(clip, 'warping', False))
+            self._warp_markers = self._read_warp_markers(clip)
+        except Exception as e:
+            self._log_error("_on_clip_loop_changed", e)
+            return
+        self._recompute_beats_per_column()
+        self._mark_grid_dirty()
+        self._log_info("Clip loop changed: %.2f to %.2f beats, %d warp markers",
+                       info.loop_start, info.loop_end, len(self._warp_markers))
     
-    def _has_warp_marker(self, time, tolerance):
-        """Check if there's a warp marker near this time."""
-        for marker_time in self._warp_markers:
-            if abs(time - marker_time) < tolerance:
-                return True
-        return False
+    def _read_warp_markers(self, clip):
+        """Sorted beat times of the clip's warp markers (Live 12: Clip.warp_markers)."""
+        return tuple(sorted(float(marker.beat_time) for marker in getattr(clip, 'warp_markers', ())))
     
     def is_audio_mode(self):
         """
@@ -209,7 +447,7 @@ class ClipSequencer(SequencerBase):
         Returns:
             bool: True if audio clip is loaded
         """
-        return bool(self._audio_clip_info)
+        return self._audio_clip_info is not None
     
     def render_view_leds(self, track_select_buttons, bank_pressed):
         """
@@ -254,12 +492,13 @@ class ClipSequencer(SequencerBase):
             self._log_info("Audio view mode set to %d" % mode_index)
             
             # Calculate zoom pages based on view mode
-            if mode_index == 0:
-                self._zoom_pages = 1  # Full view
-            elif mode_index <= 4:
-                self._zoom_pages = [1, 2, 4, 8][mode_index - 1] if mode_index > 0 else 1
-            else:
-                self._zoom_pages = [0.5, 0.25, 0.125][mode_index - 5] if mode_index >= 5 else 1
+            self._zoom_pages = self._ZOOM_TABLE.get(mode_index, 1)
+            self._recompute_beats_per_column()
+            self._dirty_version += 1
+            
+            clip = self._get_cached_clip()
+            if clip is not None and self._audio_clip_info is not None:
+                self._request_color_cache(clip)
             
         except Exception as e:
             self._log_error("set_view_mode", e)
@@ -278,28 +517,33 @@ class ClipSequencer(SequencerBase):
         """
         try:
             clip = self._ensure_clip()
-            if clip is None or not self._audio_clip_info:
+            if clip is None or self._audio_clip_info is None:
                 return False
             
             # Calculate beat position
-            loop_length = self._audio_clip_info['loop_end'] - self._audio_clip_info['loop_start']
-            beats_per_column = loop_length / (self._steps_per_page * self._zoom_pages)
-            beat_position = self._audio_clip_info['loop_start'] + (col * beats_per_column)
+            beat_position = self._audio_clip_info.loop_start + (col * self._beats_per_column)
             
             # Check if marker exists
-            if hasattr(clip, 'get_warp_markers'):
-                markers = clip.get_warp_markers()
+            get_warp_markers = getattr(clip, 'get_warp_markers', None)
+            if get_warp_markers is not None:
+                markers = get_warp_markers()
                 marker_exists = any(abs(m - beat_position) < 0.01 for m in markers)
                 
                 if marker_exists:
                     # Remove marker
-                    if hasattr(clip, 'remove_warp_marker'):
-                        clip.remove_warp_marker(beat_position)
+                    remove_warp_marker = getattr(clip, 'remove_warp_marker', None)
+                    if remove_warp_marker is not None:
+                        remove_warp_marker(beat_position)
+                        self._warp_markers = tuple(m for m in self._warp_markers if abs(m - beat_position) >= 0.01)
+                        self._mark_grid_dirty()
                         self._log_info("Removed warp marker at beat %.2f" % beat_position)
                 else:
                     # Create marker
-                    if hasattr(clip, 'create_warp_marker'):
-                        clip.create_warp_marker(beat_position)
+                    create_warp_marker = getattr(clip, 'create_warp_marker', None)
+                    if create_warp_marker is not None:
+                        create_warp_marker(beat_position)
+                        self._warp_markers = tuple(sorted(self._warp_markers + (beat_position,)))
+                        self._mark_grid_dirty()
                         self._log_info("Created warp marker at beat %.2f" % beat_position)
                 
                 return True
@@ -317,9 +561,11 @@ class ClipSequencer(SequencerBase):
             if clip is None:
                 return False
             
-            if hasattr(clip, 'is_reversed'):
-                clip.is_reversed = not clip.is_reversed
-                state = "REVERSED" if clip.is_reversed else "NORMAL"
+            is_reversed = getattr(clip, 'is_reversed', _MISSING)
+            if is_reversed is not _MISSING:
+                is_reversed = not is_reversed
+                clip.is_reversed = is_reversed
+                state = "REVERSED" if is_reversed else "NORMAL"
                 self._log_info("Audio playback: %s" % state)
                 return True
             
@@ -343,7 +589,9 @@ class ClipSequencer(SequencerBase):
             
             if hasattr(clip, 'gain'):
                 # Convert dB to linear
-                gain_linear = pow(10.0, gain_db / 20.0)
+                gain_linear = self._GAIN_LUT.get(gain_db)
+                if gain_linear is None:
+                    gain_linear = pow(10.0, gain_db / 20.0)
                 clip.gain = gain_linear
                 self._log_info("Gain set to %.1f dB (linear=%.2f)" % (gain_db, gain_linear))
                 return True
@@ -361,12 +609,12 @@ class ClipSequencer(SequencerBase):
             if clip is None:
                 return False
             
-            if hasattr(clip, 'warp_mode'):
+            current = getattr(clip, 'warp_mode', _MISSING)
+            if current is not _MISSING:
                 # Cycle: Beats (0) → Complex/RAM (4) → Complex Pro/HiQ (6)
                 modes = [0, 4, 6]
                 mode_names = {0: "Beats", 4: "Complex/RAM", 6: "Complex Pro/HiQ"}
                 
-                current = clip.warp_mode
                 try:
                     current_index = modes.index(current)
                     next_index = (current_index + 1) % len(modes)
@@ -417,8 +665,12 @@ class ClipSequencer(SequencerBase):
                 return False
             
             if hasattr(clip, 'loop_start'):
-                clip.loop_start = float(beat_position)
-                self._audio_clip_info['loop_start'] = float(beat_position)
+                pos = beat_position if type(beat_position) is float else float(beat_position)
+                clip.loop_start = pos
+                if self._audio_clip_info is not None:
+                    self._audio_clip_info.loop_start = pos
+                self._mark_grid_dirty()
+                self._recompute_beats_per_column()
                 self._log_info("Loop start set to beat %.2f" % beat_position)
                 return True
             
@@ -436,8 +688,12 @@ class ClipSequencer(SequencerBase):
                 return False
             
             if hasattr(clip, 'loop_end'):
-                clip.loop_end = float(beat_position)
-                self._audio_clip_info['loop_end'] = float(beat_position)
+                pos = beat_position if type(beat_position) is float else float(beat_position)
+                clip.loop_end = pos
+                if self._audio_clip_info is not None:
+                    self._audio_clip_info.loop_end = pos
+                self._mark_grid_dirty()
+                self._recompute_beats_per_column()
                 self._log_info("Loop end set to beat %.2f" % beat_position)
                 return True
             
@@ -460,16 +716,19 @@ class ClipSequencer(SequencerBase):
                 return False
             
             # Calculate bar boundaries (4 beats per bar)
-            start = float((bar_number - 1) * 4)
-            end = float(bar_number * 4)
+            start = (bar_number - 1) * 4.0
+            end = bar_number * 4.0
             
             if hasattr(clip, 'loop_start') and hasattr(clip, 'loop_end'):
                 clip.loop_start = start
                 clip.loop_end = end
                 clip.looping = True
                 
-                self._audio_clip_info['loop_start'] = start
-                self._audio_clip_info['loop_end'] = end
+                if self._audio_clip_info is not None:
+                    self._audio_clip_info.loop_start = start
+                    self._audio_clip_info.loop_end = end
+                self._mark_grid_dirty()
+                self._recompute_beats_per_column()
                 
                 self._log_info("Looping bar %d (beats %.1f-%.1f)" % (bar_number, start, end))
                 return True
@@ -495,18 +754,28 @@ class ClipSequencer(SequencerBase):
         super(ClipSequencer, self).enter()
         
         # Detect audio clip and extract info
+        self._mark_grid_dirty()
         if self.detect_audio_clip():
+            self._request_color_cache(self._get_cached_clip())
             self._log_info("Audio clip mode active")
             self._log_info("Loop: %.1f to %.1f beats" % 
-                         (self._audio_clip_info['loop_start'],
-                          self._audio_clip_info['loop_end']))
+                         (self._audio_clip_info.loop_start,
+                          self._audio_clip_info.loop_end))
         else:
             self._log_info("No audio clip detected")
     
     def exit(self):
         """Exit audio clip sequencer mode."""
         super(ClipSequencer, self).exit()
-        self._audio_clip_info = {}
-        self._warp_markers = []
+        self._audio_clip_info = None
+        self._last_clip = None
+        self._watch_clip(None)
+        self._beats_per_column = 0.0
+        self._warp_markers = ()
+        self._mark_grid_dirty()
+        self._pending_color_key = None
+        self._last_matrix_rows = None
+        self._frame_clip = None
+        self._rendered_clip = None
         self._bank_mode = False
         self._view_mode = 0
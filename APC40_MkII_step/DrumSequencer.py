@@ -1,13 +1,175 @@
 from __future__ import absolute_import, print_function, unicode_literals
+import math
+from time import monotonic
+from bisect import bisect_left
 import Live
 from .SequencerBase import SequencerBase
 
+# Live 11+ note spec class, bound once; None on older Live, where notes go through set_notes
+try:
+    _MidiNoteSpecification = Live.Clip.MidiNoteSpecification
+except AttributeError:
+    _MidiNoteSpecification = None
+
+# Overlap margin shared by the note/cell overlap tests
+_OVERLAP_EPSILON = 1e-5
+
+# Drum function ids (8 is unused); _FUNCTION_NAMES and the colour list are indexed by id
+_FUNCTION_NONE = 0
+_FUNCTION_CLEAR = 1
+_FUNCTION_COPY = 2
+_FUNCTION_PASTE = 3
+_FUNCTION_MPE = 4
+_FUNCTION_FILL_QUARTER = 5
+_FUNCTION_FILL_EIGHTH = 6
+_FUNCTION_FILL_SIXTEENTH = 7
+_FUNCTION_FILL_WHOLE = 9
+_FUNCTION_QUANT_TRIPLET = 10
+_FUNCTION_QUANT_SEPTUPLET = 11
+
+# Order the master button and scene buttons cycle through
+_FUNCTION_CYCLE = (
+    _FUNCTION_NONE,
+    _FUNCTION_CLEAR,
+    _FUNCTION_COPY,
+    _FUNCTION_PASTE,
+    _FUNCTION_MPE,
+    _FUNCTION_FILL_QUARTER,
+    _FUNCTION_FILL_EIGHTH,
+    _FUNCTION_FILL_SIXTEENTH,
+    _FUNCTION_FILL_WHOLE,
+    _FUNCTION_QUANT_TRIPLET,
+    _FUNCTION_QUANT_SEPTUPLET
+)
+
+# Function id -> the one after it in _FUNCTION_CYCLE (wrapping back to NONE)
+_FUNCTION_NEXT = dict(zip(_FUNCTION_CYCLE, _FUNCTION_CYCLE[1:] + _FUNCTION_CYCLE[:1]))
+
+_FUNCTION_NAMES = (
+    "NONE", "CLEAR", "COPY", "PASTE", "MPE_MARKER",
+    "FILL_QUARTER", "FILL_EIGHTH", "FILL_SIXTEENTH", "UNKNOWN",
+    "FILL_WHOLE", "QUANT_TRIPLET", "QUANT_SEPTUPLET"
+)
+
+
+def _note_fields(note):
+    """(start, duration, velocity) of a MidiNote or a legacy get_notes tuple, tolerating missing fields."""
+    if hasattr(note, 'start_time'):
+        return note.start_time, getattr(note, 'duration', 0.0), getattr(note, 'velocity', None)
+    return (note[1],
+            note[2] if len(note) > 2 else 0.0,
+            note[3] if len(note) > 3 else None)
+
+
+def _read_note_fields(raw):
+    """
+    (start, duration, velocity) for every note in raw. A clip returns one kind of
+    note, so the first one picks a straight attribute or index loop; anything
+    irregular falls back to probing each note.
+    """
+    if not raw:
+        return []
+    try:
+        if hasattr(raw[0], 'start_time'):
+            return [(n.start_time, n.duration, n.velocity) for n in raw]
+        return [(n[1], n[2], n[3]) for n in raw]
+    except (AttributeError, IndexError, TypeError):
+        return [_note_fields(n) for n in raw]
+
+
+def _read_note_specs(raw):
+    """
+    (start, duration, velocity, mute) for every note in raw, read the same way as
+    _read_note_fields; a missing velocity reads as 100 and a missing mute as False.
+    """
+    if not raw:
+        return ()
+    try:
+        if hasattr(raw[0], 'start_time'):
+            return tuple((float(n.start_time), float(n.duration), int(n.velocity), bool(n.mute)) for n in raw)
+        return tuple((float(n[1]), float(n[2]), int(n[3]), bool(n[4])) for n in raw)
+    except (AttributeError, IndexError, TypeError):
+        specs = []
+        for n in raw:
+            start, duration, velocity = _note_fields(n)
+            if hasattr(n, 'start_time'):
+                mute = getattr(n, 'mute', False)
+            else:
+                mute = n[4] if len(n) > 4 else False
+            specs.append((float(start), float(duration), int(velocity) if velocity is not None else 100, bool(mute)))
+        return tuple(specs)
+
+
+class _RowNotes(list):
+    """
+    One drum row's notes (dicts, in clip order) plus a start-sorted index so
+    "does anything overlap this span" is a binary search instead of a scan.
+    note_starts/durations hold the same notes as parallel lists, in clip order,
+    for the per-cell visual code.
+    """
+    __slots__ = ('starts', 'max_ends', 'note_starts', 'durations')
+    
+    def __init__(self, notes=()):
+        super(_RowNotes, self).__init__(notes)
+        self.note_starts = [n['start'] for n in self]
+        self.durations = [n['duration'] for n in self]
+        ordered = sorted(self, key=lambda n: n['start'])
+        self.starts = [n['start'] for n in ordered]
+        # max_ends[i]: latest note end among the i+1 earliest-starting notes
+        self.max_ends = []
+        latest = float('-inf')
+        for n in ordered:
+            latest = max(latest, n['start'] + n['duration'])
+            self.max_ends.append(latest)
+    
+    def overlaps(self, start, end):
+        """True if a note starts before end and ends after start (both by _OVERLAP_EPSILON)."""
+        count = bisect_left(self.starts, end - _OVERLAP_EPSILON)
+        return count > 0 and self.max_ends[count - 1] > start + _OVERLAP_EPSILON
+
+
+class _PlayheadFrame(object):
+    """
+    What redrawing a content cell needs during one playhead tick, worked out once per tick,
+    plus the (col, row) cells already redrawn so a cell restored twice in a tick is sent once.
+    """
+    __slots__ = ('clip', 'cells', 'matrix_rows', 'content_rows', 'page_start', 'page_len', 'note_len',
+                 'loop_length', 'col_starts', 'x_off', 'y_off', 'right_red_col', 'done')
+    
+    def __init__(self, clip, cells, matrix_rows, content_rows, page_start, page_len, note_len,
+                 loop_length, col_starts, x_off, y_off, right_red_col):
+        self.clip = clip
+        self.cells = cells
+        self.matrix_rows = matrix_rows
+        self.content_rows = content_rows
+        self.page_start = page_start
+        self.page_len = page_len
+        self.note_len = note_len
+        self.loop_length = loop_length
+        self.col_starts = col_starts
+        self.x_off = x_off
+        self.y_off = y_off
+        self.right_red_col = right_red_col
+        self.done = set()
+
+
 class DrumSequencer(SequencerBase):
     """
     Drum-specific sequencer functionality.
     Handles drum rack detection, drum pad management, and drum-specific operations.
     """
     
+    # Cached note windows kept before the notes cache is emptied (a page scroll adds up to 5)
+    _NOTES_CACHE_LIMIT = 256
+    
+    # Per-tick playhead diagnostics (clip properties, position, every lit pad); off by default
+    # because they are formatted on every tick. A once-per-second summary is always logged.
+    _VERBOSE_PLAYHEAD_LOG = False
+    
+    # Per-button scene function LED lines; off by default,
+    # each render logs one summary of the colours sent instead
+    _VERBOSE_SCENE_LED_LOG = False
+    
     def __init__(self, control_surface, song, logger=None):
         """
         Initialize the drum sequencer.
@@ -24,78 +186,114 @@ class DrumSequencer(SequencerBase):
         self._row_note_offsets = [51, 50, 49, 48, 47, 46, 45, 44, 43, 42, 41, 40, 39, 38, 37, 36]
         self._selected_drum = 0
         
-        # Per-drum buffers for MPE values
-        self._drum_velocity = [64] * 16
-        self._drum_pressure = [0] * 16
+        # Per-drum buffers for MPE values (MIDI 0-127, one byte each)
+        self._drum_velocity = bytearray([64] * 16)
+        self._drum_pressure = bytearray(16)
         
         # Function system
-        self._drum_functions = [0] * 16  # 0=none, 1=clear, 2=copy, 3=paste, etc.
+        self._drum_functions = bytearray(16)  # 0=none, 1=clear, 2=copy, 3=paste, etc.
         self._current_function = 0  # Currently selected function for master button
         self._copied_notes = None  # Buffer for copy/paste
+        # Clip edits collected while a function runs on several drums (see _begin_note_batch)
+        self._note_batch = None
         
-        # Function color mapping
-        self._FUNCTION_NONE = 0
-        self._FUNCTION_CLEAR = 1
-        self._FUNCTION_COPY = 2
-        self._FUNCTION_PASTE = 3
-        self._FUNCTION_MPE = 4
-        self._FUNCTION_FILL_QUARTER = 5
-        self._FUNCTION_FILL_EIGHTH = 6
-        self._FUNCTION_FILL_SIXTEENTH = 7
-        self._FUNCTION_FILL_WHOLE = 9
-        self._FUNCTION_QUANT_TRIPLET = 10
-        self._FUNCTION_QUANT_SEPTUPLET = 11
-        
-        self._function_colors = {
-            self._FUNCTION_NONE: self._LED_OFF,
-            self._FUNCTION_CLEAR: self._LED_RED,
-            self._FUNCTION_COPY: self._LED_YELLOW,
-            self._FUNCTION_PASTE: self._LED_ORANGE,
-            self._FUNCTION_MPE: self._LED_BLUE,
-            self._FUNCTION_FILL_QUARTER: self._LED_PURPLE,
-            self._FUNCTION_FILL_EIGHTH: self._LED_DARK_PURPLE,
-            self._FUNCTION_FILL_SIXTEENTH: self._LED_BROWN,
-            self._FUNCTION_FILL_WHOLE: self._LED_DARK_BROWN,
-            self._FUNCTION_QUANT_TRIPLET: self._LED_PINK,
-            self._FUNCTION_QUANT_SEPTUPLET: self._LED_CYAN
-        }
-        
-        self._function_names = {
-            self._FUNCTION_NONE: "NONE",
-            self._FUNCTION_CLEAR: "CLEAR",
-            self._FUNCTION_COPY: "COPY",
-            self._FUNCTION_PASTE: "PASTE",
-            self._FUNCTION_MPE: "MPE_MARKER",
-            self._FUNCTION_FILL_QUARTER: "FILL_QUARTER",
-            self._FUNCTION_FILL_EIGHTH: "FILL_EIGHTH",
-            self._FUNCTION_FILL_SIXTEENTH: "FILL_SIXTEENTH",
-            self._FUNCTION_FILL_WHOLE: "FILL_WHOLE",
-            self._FUNCTION_QUANT_TRIPLET: "QUANT_TRIPLET",
-            self._FUNCTION_QUANT_SEPTUPLET: "QUANT_SEPTUPLET"
-        }
+        # Function colour per function id (_FUNCTION_*), unused ids stay dark; padded to 256
+        # entries below so any _drum_functions byte indexes it without a bounds check
+        function_colors = [
+            self._LED_OFF,          # NONE
+            self._LED_RED,          # CLEAR
+            self._LED_YELLOW,       # COPY
+            self._LED_ORANGE,       # PASTE
+            self._LED_BLUE,         # MPE
+            self._LED_PURPLE,       # FILL_QUARTER
+            self._LED_DARK_PURPLE,  # FILL_EIGHTH
+            self._LED_BROWN,        # FILL_SIXTEENTH
+            self._LED_OFF,          # (unused)
+            self._LED_DARK_BROWN,   # FILL_WHOLE
+            self._LED_PINK,         # QUANT_TRIPLET
+            self._LED_CYAN          # QUANT_SEPTUPLET
+        ]
+        self._function_colors = tuple(function_colors) + (self._LED_OFF,) * (256 - len(function_colors))
         
         # Scene preview state
         self._scene_preview_active = False
         self._scene_preview_color = self._LED_OFF
         self._scene_preview_count = 0
         self._scene_preview_target = 10  # Number of ticks (~1 second at 90ms/tick)
+        self._scene_led_shadow = {}  # Scene launch index -> colour last sent (function LEDs or preview)
 
         # Playhead tracking state
         self._last_blink_col = None
         self._clip_stop_blink_state = False
+        self._clip_stop_led_shadow = {}  # Clip stop index -> colour last sent by the playhead
+        self._clip_stop_state_key = None  # (playing page, loop pages, shown page, blink) last drawn
         self._last_loop_position_page = None
         self._blink_phase = 0
+        self._last_step_idx = None  # Step index of the previous playhead tick
+        self._last_trail_cols = []  # Columns lit as playhead trail on the previous tick
+        self._trail_ttls = bytearray(self._steps_per_page)  # Micro-length trail: ticks left per column (0 = unlit)
+        self._clip_stop_tick_ctr = 0
+        # Inputs and pad write count of the last playhead tick that drew (see _render_playhead)
+        self._playhead_render_key = None
+        self._playhead_led_writes = -1
         
         # Boundary warning state
         self._boundary_warning_active = False
         self._boundary_direction = None  # 'up', 'down', 'left', 'right'
         self._boundary_blink_count = 0
+        self._boundary_blink_mask = 15  # Blink cycle of 16 ticks: 4 on, 4 off
         self._boundary_blink_max = 6  # 3 full on/off cycles
         self._boundary_blinking = False
         # Navigable boundary offsets (-1,0,+1) for top/left and bottom/right virtual bars
         self._x_boundary_offset = 0  # -1 = left virtual column, +1 = right virtual column
         self._y_boundary_offset = 0  # -1 = top virtual row, +1 = bottom virtual row
         
+        # Per-row note windows read from the clip, keyed by (pitch, fetch start, fetch length);
+        # dropped when the clip changes, its notes change, or we edit them ourselves
+        self._notes_cache = {}
+        self._notes_cache_clip = None
+        self._notes_epoch = 0  # Bumped whenever cached notes are dropped
+        
+        # Per-row notes and cell colours of the last render (see _page_row_notes)
+        self._page_notes_cache = {}
+        
+        # Note-cell colours from the last full render, reused while _grid_state_key is unchanged
+        self._rendered_grid_key = None
+        self._rendered_grid_cells = {}
+        
+        # Copy of _row_note_offsets and a counter bumped when its contents change (see _row_offsets_version)
+        self._row_offsets_seen = self._row_note_offsets[:]
+        self._row_offsets_counter = 0
+        
+        # Column start beats for the current page and note length (see _column_starts)
+        self._column_starts_key = None
+        self._column_starts_lut = ()
+        
+        # Right boundary column for the last (page start, note length, loop length) asked about
+        self._right_red_col_key = None
+        self._right_red_col_value = 0
+        
+        # Pitch per visible row for the current row base (see _visible_pitches)
+        self._visible_pitches_key = None
+        self._visible_pitches_lut = ()
+        # Drum with a function slot per scene launch button (see _visible_drums)
+        self._visible_drums_key = None
+        self._visible_drums_map = ()
+        
+        # Which note APIs the current clip offers, probed once per clip (see _clip_note_api)
+        self._clip_api_clip = None
+        self._clip_api = (False, False, False)
+        # Note method name -> whether Live took a list for it (absent until the first call)
+        self._note_list_accepted = {}
+        
+        # monotonic() time of the last once-per-second playhead log line
+        self._last_playhead_log = None
+        
+        # (track, loaded drum pad notes) per track id, dropped when a watched track's devices
+        # change; the track is kept so a recycled id can't hand out another track's pads
+        self._drum_rack_cache = {}
+        self._drum_rack_tracks = []
+        
     # ==================== DRUM DETECTION ====================
     
     def _detect_drum_rack(self):
@@ -110,6 +308,24 @@ class DrumSequencer(SequencerBase):
             if not track or not hasattr(track, 'devices'):
                 return self._row_note_offsets
             
+            cached = self._drum_rack_cache.get(id(track))
+            if cached is not None and cached[0] == track:
+                return cached[1]
+            
+            pads = self._scan_drum_rack(track)
+            self._drum_rack_cache[id(track)] = (track, pads)
+            if hasattr(track, 'add_devices_listener') and not track.devices_has_listener(self._on_track_devices_changed):
+                track.add_devices_listener(self._on_track_devices_changed)
+                self._drum_rack_tracks.append(track)
+            return pads
+            
+        except Exception as e:
+            self._log_error("_detect_drum_rack", e)
+            return self._row_note_offsets
+    
+    def _scan_drum_rack(self, track):
+        """Walk the track's devices for a drum rack; returns its loaded pad notes or the default range."""
+        try:
             # Look for drum rack device
             for device in track.devices:
                 if hasattr(device, 'can_have_drum_pads') and device.can_have_drum_pads:
@@ -133,114 +349,70 @@ class DrumSequencer(SequencerBase):
             return self._row_note_offsets
             
         except Exception as e:
-            self._log_error("_detect_drum_rack", e)
+            self._log_error("_scan_drum_rack", e)
             return self._row_note_offsets
     
+    def _on_track_devices_changed(self):
+        """A watched track's device list changed; rescan drum racks on next detection."""
+        self._drum_rack_cache = {}
+    
+    def _release_drum_rack_cache(self):
+        """Drop cached drum pads and stop watching track device lists."""
+        for track in self._drum_rack_tracks:
+            try:
+                if track.devices_has_listener(self._on_track_devices_changed):
+                    track.remove_devices_listener(self._on_track_devices_changed)
+            except Exception:
+                pass  # Track may already be deleted
+        self._drum_rack_tracks = []
+        self._drum_rack_cache = {}
+    
     # ==================== GRID RENDERING ====================
     
     def refresh_grid(self, matrix_rows):
         """
-        Refresh the grid to show current drum notes.
+        Refresh the grid to show current drum notes. The clear, note, playhead
+        and boundary passes land in one LED frame, so only the final colour of
+        each pad is sent.
         
         Args:
             matrix_rows: The matrix button rows
         """
+        self._begin_led_frame()
+        try:
+            self._render_grid(matrix_rows)
+        finally:
+            self._end_led_frame(matrix_rows)
+    
+    def _render_grid(self, matrix_rows):
+        """Draw notes, playhead and boundary bars (see refresh_grid)."""
         self._cs.log_message("refresh_grid: Starting")
         clip = self._get_cached_clip()
         if clip is None:
             self._cs.log_message("refresh_grid: No clip, clearing LEDs")
             self._clear_all_leds(matrix_rows)
             self._reset_grid_blink_states()
+            self._rendered_grid_key = None
             return
         
         self._cs.log_message("refresh_grid: Got clip, rendering notes")
 
-        try:
-            loop_length = self._loop_bars_options[self._loop_bars_index] * 4.0
-            note_len = self._note_lengths[self._note_length_index]
-            page_start = self._time_page * self._steps_per_page * note_len
-            page_length = self._steps_per_page * note_len
-
-            self._clear_all_leds(matrix_rows)
-            self._reset_grid_blink_states()
-
-            self._page_notes_cache = {
-                'page_start': page_start,
-                'page_length': page_length,
-                'rows': {}
-            }
-
-            # Determine dynamic right boundary col (used when x-boundary active on right)
-            def _compute_right_red_col():
-                last_valid = -1
-                for c in range(self._steps_per_page):
-                    if page_start + c * note_len < loop_length:
-                        last_valid = c
-                # Red column immediately after last valid, clamped to grid
-                red_col = last_valid + 1
-                if red_col < 0:
-                    red_col = 0
-                if red_col >= self._steps_per_page:
-                    red_col = self._steps_per_page - 1
-                return red_col
-
-            x_off = getattr(self, '_x_boundary_offset', 0)
-            y_off = getattr(self, '_y_boundary_offset', 0)
-
-            rendered_cells = 0
-            bottom_row_index = min(self._rows_visible - 1, len(matrix_rows) - 1)
-            right_red_col = _compute_right_red_col()
-
-            for row in range(self._rows_visible):
-                # Skip drawing content in virtual boundary row
-                if (y_off == -1 and row == 0) or (y_off == 1 and row == bottom_row_index):
-                    # Boundary bar drawn later
-                    continue
-
-                # Map visible row to drum index
-                visible_row = row - 1 if y_off == -1 else row
-                row_offset = visible_row + self._drum_row_base
-                if row_offset < 0 or row_offset >= len(self._row_note_offsets):
-                    continue
-
-                pitch = self._row_note_offsets[row_offset]
-                row_is_selected = (row_offset == self._selected_drum)
-                notes_for_row = self._collect_notes_for_row(clip, pitch, page_start, page_length)
-                self._page_notes_cache['rows'][visible_row] = notes_for_row
-
-                for col in range(self._steps_per_page):
-                    # Skip drawing content in virtual boundary column
-                    if x_off == -1 and col == 0:
-                        continue
-                    if x_off == 1:
-                        if col == right_red_col:
-                            continue
-                        if col > right_red_col:
-                            continue
-
-                    effective_col = col - (1 if x_off == -1 else 0)
-                    column_start = page_start + effective_col * note_len
-                    if column_start < 0 or column_start >= loop_length:
-                        continue
-
-                    color, pattern, subdivision = self._compute_cell_visual(notes_for_row, column_start, note_len, row_is_selected)
-
-                    if pattern:
-                        self._set_pad_led_color(col, row, pattern[0], matrix_rows)
-                        self._register_grid_blink(row, col, pattern, subdivision)
-                        rendered_cells += 1
-                    else:
-                        self._set_pad_led_color(col, row, color, matrix_rows)
-                        self._register_grid_blink(row, col, None, 0)
-                        if color != self._LED_OFF:
-                            rendered_cells += 1
-
-            self._log_debug("refresh_grid: rendered %d active cells" % rendered_cells)
-
-        except Exception as e:
-            self._log_error("refresh_grid", e)
-            # If refresh fails, make sure any stale playhead column is cleared safely
-            self._clear_playhead_column(matrix_rows)
+        # Note content only depends on _grid_state_key; when that is unchanged the last
+        # rendered cells are replayed into the frame instead of being recomputed
+        if self._grid_state_key(clip) == self._rendered_grid_key:
+            self._replay_note_cells(matrix_rows)
+        else:
+            self._rendered_grid_key = None
+            try:
+                self._render_note_cells(clip, matrix_rows)
+                frame = self._pad_led_frame
+                if frame is not None:
+                    self._rendered_grid_cells = dict(frame)
+                    self._rendered_grid_key = self._grid_state_key(clip)
+            except Exception as e:
+                self._log_error("refresh_grid", e)
+                # If refresh fails, make sure any stale playhead column is cleared safely
+                self._clear_playhead_column(matrix_rows)
 
         # Reapply playhead highlight after redraw so it doesn't disappear until next tick
         try:
@@ -254,6 +426,173 @@ class DrumSequencer(SequencerBase):
         except Exception as exc:
             self._log_error("refresh_grid(draw_static_boundaries)", exc)
 
+    def _render_note_cells(self, clip, matrix_rows):
+        """Clear the grid and draw each visible drum row's note cells, registering blink patterns."""
+        # Attributes and bound methods used per cell, read once
+        steps_per_page = self._steps_per_page
+        rows_visible = self._rows_visible
+        visible_pitches = self._visible_pitches()
+        selected_row = self._selected_drum - self._drum_row_base
+        led_off = self._LED_OFF
+        set_pad = self._set_pad_led_color
+        register_blink = self._register_grid_blink
+        compute_visual = self._compute_cell_visual
+
+        loop_length = self._loop_bars_options[self._loop_bars_index] * 4.0
+        note_len = self._note_lengths[self._note_length_index]
+        page_start = self._time_page * steps_per_page * note_len
+        page_length = steps_per_page * note_len
+
+        self._clear_all_leds(matrix_rows)
+        self._reset_grid_blink_states()
+
+        page_rows = {}
+        page_cells = {}
+        self._page_notes_cache = {
+            'page_start': page_start,
+            'page_length': page_length,
+            'rows': page_rows,
+            'cells': page_cells  # (visible row, page column) -> content colour drawn
+        }
+
+        x_off = self._x_boundary_offset
+        y_off = self._y_boundary_offset
+
+        rendered_cells = 0
+        col_starts = self._column_starts(note_len)
+
+        # Drawable (col, column_start) and (row, visible_row) pairs are the same for every
+        # cell, so boundary handling is settled here and the cell loop has no boundary tests.
+        # Without a virtual boundary (the usual case) the mapping is the identity.
+        col_shift = 1 if x_off == -1 else 0
+        if not x_off:
+            drawable_cols = [(col, column_start) for col, column_start in enumerate(col_starts)
+                             if 0 <= column_start < loop_length]
+        else:
+            # Skip the virtual boundary columns and anything outside the loop
+            right_red_col = self._right_red_col(page_start, note_len, loop_length)
+            drawable_cols = []
+            for col in range(steps_per_page):
+                if x_off == -1 and col == 0:
+                    continue
+                if x_off == 1 and col >= right_red_col:
+                    continue
+                if col - col_shift < 0:
+                    continue
+                column_start = col_starts[col - col_shift]
+                if column_start < 0 or column_start >= loop_length:
+                    continue
+                drawable_cols.append((col, column_start))
+
+        if not y_off:
+            drawable_rows = [(row, row) for row in range(rows_visible)]
+        else:
+            # Skip the virtual boundary row (its bar is drawn later) and shift rows below a top bar
+            bottom_row_index = min(rows_visible - 1, len(matrix_rows) - 1)
+            drawable_rows = []
+            for row in range(rows_visible):
+                if (y_off == -1 and row == 0) or (y_off == 1 and row == bottom_row_index):
+                    continue
+                drawable_rows.append((row, row - 1 if y_off == -1 else row))
+
+        for row, visible_row in drawable_rows:
+            pitch = visible_pitches[visible_row]
+            if pitch < 0:
+                continue
+
+            row_is_selected = (visible_row == selected_row)
+            notes_for_row = self._collect_notes_for_row(clip, pitch, page_start, page_length)
+            page_rows[visible_row] = notes_for_row
+
+            if not notes_for_row:
+                # Empty row: every cell is the plain base colour
+                base_color = self._LED_BLUE if row_is_selected else led_off
+                for col, _ in drawable_cols:
+                    set_pad(col, row, base_color, matrix_rows)
+                    register_blink(row, col, None, 0)
+                    page_cells[(visible_row, col - col_shift)] = base_color
+                if base_color != led_off:
+                    rendered_cells += len(drawable_cols)
+                continue
+
+            for col, column_start in drawable_cols:
+                color, pattern, subdivision = compute_visual(notes_for_row, column_start, note_len, row_is_selected)
+
+                if pattern:
+                    set_pad(col, row, pattern[0], matrix_rows)
+                    register_blink(row, col, pattern, subdivision)
+                    page_cells[(visible_row, col - col_shift)] = pattern[0]
+                    rendered_cells += 1
+                else:
+                    set_pad(col, row, color, matrix_rows)
+                    register_blink(row, col, None, 0)
+                    page_cells[(visible_row, col - col_shift)] = color
+                    if color != led_off:
+                        rendered_cells += 1
+
+        # Stamped after the rows are fetched (fetching for a new clip drops the notes cache)
+        self._page_notes_cache['epoch'] = self._notes_epoch
+        self._log_debug("refresh_grid: rendered %d active cells" % rendered_cells)
+
+    def _replay_note_cells(self, matrix_rows):
+        """Re-apply the last rendered note cells and restart their blink patterns."""
+        for (col, row), color in self._rendered_grid_cells.items():
+            self._set_pad_led_color(col, row, color, matrix_rows)
+        for state in self._grid_blink_states.values():
+            state['last_index'] = -1
+        self._logger.log('GRID_REFRESH', "Grid state unchanged, replayed %d cells" % len(self._rendered_grid_cells))
+
+    def _grid_state_key(self, clip):
+        """Everything the drawn note cells depend on (including state StepSequencer changes directly)."""
+        return (clip, self._notes_epoch,
+                self._time_page, self._drum_row_base, self._row_offsets_version(),
+                self._note_length_index, self._note_lengths[self._note_length_index],
+                self._triplet_mode, self._septuplet_mode, self._loop_bars_index, self._selected_drum,
+                self._x_boundary_offset, self._y_boundary_offset,
+                self._boundary_warning_active, self._boundary_direction, self._boundary_blinking)
+
+    def _row_offsets_version(self):
+        """Counter for the contents of _row_note_offsets, bumped when it is reassigned or edited in place."""
+        offsets = self._row_note_offsets
+        if offsets != self._row_offsets_seen:
+            self._row_offsets_seen = offsets[:]
+            self._row_offsets_counter += 1
+        return self._row_offsets_counter
+
+    def _page_cell_colors(self, clip):
+        """Content colours from the last note-cell render, or None if the grid state has changed since."""
+        if self._rendered_grid_key is None or self._grid_state_key(clip) != self._rendered_grid_key:
+            return None
+        return self._page_notes_cache.get('cells')
+
+    def _content_cell_color(self, clip, cells, eff_row, eff_col, step_start, page_start, page_len, note_len):
+        """
+        Colour a content cell shows once an overlay (playhead, trail) moves off it: looked up
+        in cells (see _page_cell_colors) when the render drew it, otherwise recomputed.
+        """
+        if cells:
+            color = cells.get((eff_row, eff_col))
+            if color is not None:
+                return color
+        pitch_index = eff_row + self._drum_row_base
+        notes_for_row = self._page_row_notes(clip, eff_row, page_start, page_len)
+        color, pattern, subdivision = self._compute_cell_visual(notes_for_row, step_start, note_len, (pitch_index == self._selected_drum))
+        return pattern[0] if pattern else color
+
+    def _page_row_notes(self, clip, eff_row, page_start, page_len):
+        """
+        Notes of a visible row on this page: the ones the last render fetched while the
+        clip's notes haven't changed since, otherwise from the notes cache.
+        """
+        cache = self._page_notes_cache
+        if (cache.get('epoch') == self._notes_epoch and cache.get('page_start') == page_start
+                and cache.get('page_length') == page_len):
+            notes_for_row = cache['rows'].get(eff_row)
+            if notes_for_row is not None:
+                return notes_for_row
+        pitch = self._row_note_offsets[eff_row + self._drum_row_base]
+        return self._collect_notes_for_row(clip, pitch, page_start, page_len)
+
     def _check_note_at_step(self, clip, pitch, start, note_len):
         """
         Check if there's a note at the given step.
@@ -272,7 +611,7 @@ class DrumSequencer(SequencerBase):
             search_start = max(0.0, start - tolerance)
             search_duration = max(tolerance * 2, 0.001)
             
-            if hasattr(clip, 'get_notes_extended'):
+            if self._clip_note_api(clip)[0]:
                 notes = clip.get_notes_extended(pitch, 1, search_start, search_duration)
             else:
                 notes = clip.get_notes(search_start, pitch, search_duration, 1)
@@ -298,8 +637,8 @@ class DrumSequencer(SequencerBase):
             # Determine color based on blink state
             blink_on = True
             if self._boundary_blinking:
-                self._boundary_blink_count = (self._boundary_blink_count + 1) % 12  # slow blink
-                blink_on = (self._boundary_blink_count // 3) % 2 == 0
+                self._boundary_blink_count = (self._boundary_blink_count + 1) & self._boundary_blink_mask  # slow blink
+                blink_on = ((self._boundary_blink_count >> 2) & 1) == 0
             color = self._LED_RED if blink_on else self._LED_OFF
 
             if self._boundary_direction == 'up':
@@ -320,11 +659,7 @@ class DrumSequencer(SequencerBase):
                 loop_length = self._loop_bars_options[self._loop_bars_index] * 4.0
                 note_len = self._note_lengths[self._note_length_index]
                 page_start = self._time_page * self._steps_per_page * note_len
-                rightmost_col = -1
-                for col in range(self._steps_per_page):
-                    column_start = page_start + col * note_len
-                    if column_start < loop_length:
-                        rightmost_col = col
+                rightmost_col = self._valid_step_count(page_start, note_len, loop_length) - 1
                 if rightmost_col >= 0:
                     for row in range(min(self._rows_visible, len(matrix_rows))):
                         self._set_pad_led_color(rightmost_col, row, color, matrix_rows)
@@ -337,52 +672,114 @@ class DrumSequencer(SequencerBase):
         These persist while at the boundary, and do not blink unless
         a repeated navigation attempt occurs (handled by _draw_boundary_warning).
         """
-        if not matrix_rows:
+        x_off = self._x_boundary_offset
+        y_off = self._y_boundary_offset
+        if (not x_off and not y_off) or not matrix_rows:
             return
         
         try:
-            # Compute time info
-            loop_length = self._loop_bars_options[self._loop_bars_index] * 4.0
-            note_len = self._note_lengths[self._note_length_index]
-            page_start = self._time_page * self._steps_per_page * note_len
-
-            x_off = getattr(self, '_x_boundary_offset', 0)
-            y_off = getattr(self, '_y_boundary_offset', 0)
+            steps_per_page = self._steps_per_page
+            rows_visible = self._rows_visible
+            led_red = self._LED_RED
+            # Direction of the bar currently blinking off, if any
+            blinking_dir = self._boundary_direction if (self._boundary_warning_active and self._boundary_blinking) else None
 
             # Draw top row if in top virtual boundary
-            if y_off == -1 and not (self._boundary_warning_active and self._boundary_blinking and self._boundary_direction == 'up'):
-                for col in range(min(self._steps_per_page, len(matrix_rows[0]))):
-                    self._set_pad_led_color(col, 0, self._LED_RED, matrix_rows)
+            if y_off == -1 and blinking_dir != 'up':
+                self._set_row_leds(0, [led_red] * min(steps_per_page, len(matrix_rows[0])), matrix_rows)
             
             # Draw bottom row if in bottom virtual boundary
-            if y_off == 1 and len(matrix_rows) > 0 and not (self._boundary_warning_active and self._boundary_blinking and self._boundary_direction == 'down'):
-                bottom_row = min(self._rows_visible - 1, len(matrix_rows) - 1)
-                for col in range(min(self._steps_per_page, len(matrix_rows[bottom_row]))):
-                    self._set_pad_led_color(col, bottom_row, self._LED_RED, matrix_rows)
+            if y_off == 1 and blinking_dir != 'down':
+                bottom_row = min(rows_visible - 1, len(matrix_rows) - 1)
+                self._set_row_leds(bottom_row, [led_red] * min(steps_per_page, len(matrix_rows[bottom_row])), matrix_rows)
+            
+            bar_height = min(rows_visible, len(matrix_rows))
             
             # Draw left column if in left virtual boundary
-            if x_off == -1 and not (self._boundary_warning_active and self._boundary_blinking and self._boundary_direction == 'left'):
-                for row in range(min(self._rows_visible, len(matrix_rows))):
-                    self._set_pad_led_color(0, row, self._LED_RED, matrix_rows)
+            if x_off == -1 and blinking_dir != 'left':
+                self._set_column_leds(0, [led_red] * bar_height, matrix_rows)
             
             # Draw right boundary column if in right virtual boundary
-            if x_off == 1 and not (self._boundary_warning_active and self._boundary_blinking and self._boundary_direction == 'right'):
-                # Determine column immediately after last valid step
-                last_valid = -1
-                for c in range(self._steps_per_page):
-                    if page_start + c * note_len < loop_length:
-                        last_valid = c
-                red_col = last_valid + 1
-                if red_col < 0:
-                    red_col = 0
-                if red_col >= self._steps_per_page:
-                    red_col = self._steps_per_page - 1
-                for row in range(min(self._rows_visible, len(matrix_rows))):
-                    self._set_pad_led_color(red_col, row, self._LED_RED, matrix_rows)
+            if x_off == 1 and blinking_dir != 'right':
+                # Column immediately after last valid step
+                loop_length = self._loop_bars_options[self._loop_bars_index] * 4.0
+                note_len = self._note_lengths[self._note_length_index]
+                page_start = self._time_page * steps_per_page * note_len
+                red_col = self._right_red_col(page_start, note_len, loop_length)
+                self._set_column_leds(red_col, [led_red] * bar_height, matrix_rows)
         except Exception as e:
             self._log_error("_draw_static_boundaries", e)
     
     
+    def _column_starts(self, note_len):
+        """Start beat of each column on the current page (page_start + col * note_len), kept until the page or note length changes."""
+        key = (self._time_page, self._steps_per_page, note_len)
+        if key != self._column_starts_key:
+            page_start = self._time_page * self._steps_per_page * note_len
+            self._column_starts_lut = tuple(page_start + col * note_len for col in range(self._steps_per_page))
+            self._column_starts_key = key
+        return self._column_starts_lut
+    
+    def _visible_pitches(self):
+        """
+        MIDI pitch of each visible drum row (-1 past the end of the loaded pads),
+        kept until the row base or the pad list changes.
+        """
+        key = (self._drum_row_base, self._rows_visible, self._row_offsets_version())
+        if key != self._visible_pitches_key:
+            offsets = self._row_note_offsets
+            base = self._drum_row_base
+            self._visible_pitches_lut = tuple(
+                offsets[base + row] if 0 <= base + row < len(offsets) else -1
+                for row in range(self._rows_visible))
+            self._visible_pitches_key = key
+        return self._visible_pitches_lut
+    
+    def _visible_drums(self, count):
+        """
+        Absolute drum index for each of count scene launch buttons (None past the loaded pads
+        or the function slots), kept until the row base or the pad list changes.
+        """
+        key = (self._drum_row_base, count, self._row_offsets_version(), len(self._drum_functions))
+        if key != self._visible_drums_key:
+            base = self._drum_row_base
+            last = min(len(self._row_note_offsets), len(self._drum_functions))
+            self._visible_drums_map = tuple(
+                base + i if 0 <= base + i < last else None
+                for i in range(count))
+            self._visible_drums_key = key
+        return self._visible_drums_map
+    
+    def _valid_step_count(self, page_start, note_len, loop_length):
+        """
+        Number of page columns that start before the loop end (always a prefix
+        of the page), matching the float test `page_start + col * note_len < loop_length`.
+        The current page is a binary search of its cached column starts; any other
+        page is estimated arithmetically, then nudged to match the test exactly.
+        """
+        if note_len > 0.0:
+            col_starts = self._column_starts(note_len)
+            if col_starts and col_starts[0] == page_start:
+                return bisect_left(col_starts, loop_length)
+        steps = self._steps_per_page
+        if note_len <= 0.0:
+            return steps if page_start < loop_length else 0
+        count = max(0, min(steps, int(math.ceil((loop_length - page_start) / note_len))))
+        while count > 0 and page_start + (count - 1) * note_len >= loop_length:
+            count -= 1
+        while count < steps and page_start + count * note_len < loop_length:
+            count += 1
+        return count
+    
+    def _right_red_col(self, page_start, note_len, loop_length):
+        """Right boundary column: just after the last valid step, clamped to the grid (kept until an input changes)."""
+        key = (page_start, note_len, loop_length, self._steps_per_page)
+        if key != self._right_red_col_key:
+            self._right_red_col_value = max(0, min(self._steps_per_page - 1,
+                                                   self._valid_step_count(page_start, note_len, loop_length)))
+            self._right_red_col_key = key
+        return self._right_red_col_value
+    
     def _clear_boundary_leds(self, matrix_rows=None):
         """Grid will be redrawn by refresh; nothing extra to clear for on-grid boundaries."""
         return
@@ -405,40 +802,236 @@ class DrumSequencer(SequencerBase):
             pass
 
     def _collect_notes_for_row(self, clip, pitch, start_time, window_length):
-        """Collect notes for a given pitch within the visible window."""
-        notes = []
+        """Collect notes for a given pitch within the visible window (cached until the notes change)."""
         epsilon = 0.001
         fetch_start = max(0.0, float(start_time) - epsilon)
         fetch_length = float(window_length) + (epsilon * 2.0)
+        if clip != self._notes_cache_clip:
+            self._watch_clip_notes(clip)
+        key = (pitch, fetch_start, fetch_length)
+        row_notes = self._notes_cache.get(key)
+        if row_notes is not None:
+            return row_notes
+        notes = []
         try:
-            if hasattr(clip, 'get_notes_extended'):
+            if self._clip_note_api(clip)[0]:
                 raw = clip.get_notes_extended(int(pitch), 1, fetch_start, fetch_length)
             else:
                 raw = clip.get_notes(fetch_start, int(pitch), fetch_length, 1)
 
-            for note in raw or []:
-                if hasattr(note, 'start_time'):
-                    start = float(note.start_time)
-                    duration_value = getattr(note, 'duration', 0.0)
-                    velocity_value = getattr(note, 'velocity', None)
-                else:
-                    start = float(note[1])
-                    duration_value = note[2] if len(note) > 2 else 0.0
-                    velocity_value = note[3] if len(note) > 3 else None
-
-                duration = max(0.0001, float(duration_value))
-                velocity = int(velocity_value) if velocity_value is not None else 100
+            notes = [{
+                'start': float(start),
+                'duration': max(0.0001, float(duration)),
+                'velocity': int(velocity) if velocity is not None else 100
+            } for start, duration, velocity in _read_note_fields(raw)]
 
-                notes.append({
-                    'start': start,
-                    'duration': duration,
-                    'velocity': velocity
-                })
+            row_notes = _RowNotes(notes)
+            cache = self._notes_cache
+            if len(cache) >= self._NOTES_CACHE_LIMIT:
+                cache.clear()
+            cache[key] = row_notes
+            return row_notes
 
         except Exception as e:
             self._log_error("_collect_notes_for_row", e)
 
-        return notes
+        return _RowNotes(notes)
+
+    def _snapshot_notes(self, clip, pitch):
+        """
+        Every note of pitch in clip as (start, duration, velocity, mute) tuples, in clip order.
+        Read from Live once and kept in the notes cache until the clip's notes change.
+        """
+        if clip != self._notes_cache_clip:
+            self._watch_clip_notes(clip)
+        length = float(clip.length)
+        key = (pitch, 'clip', length)
+        snapshot = self._notes_cache.get(key)
+        if snapshot is not None:
+            return snapshot
+        if self._clip_note_api(clip)[0]:
+            raw = clip.get_notes_extended(int(pitch), 1, 0.0, length)
+        else:
+            raw = clip.get_notes(0.0, int(pitch), length, 1)
+        snapshot = _read_note_specs(raw)
+        cache = self._notes_cache
+        if len(cache) >= self._NOTES_CACHE_LIMIT:
+            cache.clear()
+        cache[key] = snapshot
+        return snapshot
+
+    def _watch_clip_notes(self, clip):
+        """Point the notes cache at this clip and listen for note changes made outside the sequencer."""
+        previous = self._notes_cache_clip
+        if previous is not None:
+            try:
+                if previous.notes_has_listener(self._on_clip_notes_changed):
+                    previous.remove_notes_listener(self._on_clip_notes_changed)
+            except Exception:
+                pass  # Clip may already be deleted
+        self._notes_cache_clip = clip
+        self._drop_notes_cache()
+        if clip is not None and hasattr(clip, 'add_notes_listener'):
+            try:
+                clip.add_notes_listener(self._on_clip_notes_changed)
+            except Exception as e:
+                self._log_error("_watch_clip_notes", e)
+
+    def _drop_notes_cache(self):
+        """Forget cached note windows; the grid redraws its note cells on the next refresh."""
+        self._notes_cache = {}
+        self._notes_epoch += 1
+
+    def _on_clip_notes_changed(self):
+        """Clip notes were edited (here or in Live); cached note windows are stale."""
+        self._drop_notes_cache()
+
+    def _clip_note_api(self, clip):
+        """
+        (has get_notes_extended, has remove_notes_extended, has add_new_notes) for
+        clip. Probed when the clip changes rather than on every note lookup.
+        """
+        if clip is not self._clip_api_clip:
+            self._clip_api_clip = clip
+            self._clip_api = (hasattr(clip, 'get_notes_extended'),
+                              hasattr(clip, 'remove_notes_extended'),
+                              hasattr(clip, 'add_new_notes'))
+        return self._clip_api
+
+    def _add_notes(self, clip, notes):
+        """
+        Add (pitch, start, duration, velocity, mute) notes to clip in one call:
+        MidiNoteSpecifications through add_new_notes (Live 12 API), or set_notes on older clips.
+        While a note batch is open the notes are queued for _end_note_batch instead.
+        """
+        if not notes:
+            return
+        batch = self._note_batch
+        if batch is not None:
+            batch['clip'] = clip
+            batch['adds'].extend(notes)
+            return
+        if _MidiNoteSpecification is not None and self._clip_note_api(clip)[2]:
+            spec = _MidiNoteSpecification
+            self._call_with_notes(clip.add_new_notes, 'add_new_notes', [
+                spec(pitch=int(pitch), start_time=float(start), duration=float(duration),
+                     velocity=int(velocity), mute=bool(mute))
+                for pitch, start, duration, velocity, mute in notes])
+        else:
+            self._call_with_notes(clip.set_notes, 'set_notes', notes)
+
+    def _call_with_notes(self, method, name, notes):
+        """
+        Pass notes to a clip note method without copying them into a tuple while Live
+        accepts a list for it; once it has refused one (TypeError), always pass a tuple.
+        """
+        if isinstance(notes, tuple):
+            method(notes)
+            return
+        accepted = self._note_list_accepted.get(name)
+        if accepted is not False:
+            try:
+                method(notes)
+                self._note_list_accepted[name] = True
+                return
+            except TypeError:
+                if accepted:
+                    raise
+                self._note_list_accepted[name] = False
+                self._log_info("%s needs a tuple of notes, copying lists from now on", name)
+        method(tuple(notes))
+
+    def _resolve_drum(self, drum_index):
+        """
+        (pitch, clip) for a drum function on drum_index, or None if the index is out of range
+        or there is no clip. Inside a note batch the clip is looked up once for all drums.
+        """
+        offsets = self._row_note_offsets
+        if not 0 <= drum_index < len(offsets):
+            return None
+        batch = self._note_batch
+        clip = batch['clip'] if batch is not None else None
+        if clip is None:
+            clip = self._ensure_clip()
+            if clip is None:
+                return None
+            if batch is not None:
+                batch['clip'] = clip
+        return offsets[drum_index], clip
+
+    def _remove_pitch_notes(self, clip, pitch, length=None):
+        """
+        Remove every note of pitch from clip (length: clip.length, if already read). While a
+        note batch is open the removal is queued for _end_note_batch, and notes already
+        queued for that pitch are dropped.
+        """
+        batch = self._note_batch
+        if batch is not None:
+            batch['clip'] = clip
+            if pitch not in batch['removes']:
+                batch['removes'].append(pitch)
+            batch['adds'] = [note for note in batch['adds'] if note[0] != pitch]
+            return
+        if length is None:
+            length = clip.length
+        if self._clip_note_api(clip)[1]:
+            clip.remove_notes_extended(int(pitch), 1, 0.0, length)
+        else:
+            clip.remove_notes(0.0, int(pitch), length, 1)
+
+    def _begin_note_batch(self):
+        """
+        Start collecting note removals and additions (and cache invalidations) so a
+        function run on several drums edits the clip once, in _end_note_batch.
+        """
+        if self._note_batch is None:
+            self._note_batch = {'clip': None, 'removes': [], 'adds': [], 'invalidate': False}
+
+    def _end_note_batch(self):
+        """Apply the batched edits: one removal per pitch, then all additions in one call."""
+        batch = self._note_batch
+        self._note_batch = None
+        if batch is None:
+            return
+        clip = batch['clip']
+        try:
+            if clip is not None:
+                if batch['removes']:
+                    length = clip.length
+                    for pitch in batch['removes']:
+                        self._remove_pitch_notes(clip, pitch, length)
+                self._add_notes(clip, batch['adds'])
+                self._log_info("Note batch: cleared %d pitches, added %d notes",
+                               len(batch['removes']), len(batch['adds']))
+        except Exception as e:
+            self._log_error("_end_note_batch", e)
+        if batch['invalidate']:
+            self._invalidate_clip_cache()
+
+    def _reset_led_shadow(self):
+        """Forget last sent pad colours, clip stop page colours and scene function colours."""
+        super(DrumSequencer, self)._reset_led_shadow()
+        self._forget_clip_stop_leds()
+        self._scene_led_shadow = {}
+
+    def _forget_clip_stop_leds(self):
+        """Clip stop LEDs were written elsewhere (loop length display); resend them on the next tick."""
+        self._clip_stop_led_shadow = {}
+        self._clip_stop_state_key = None
+
+    def _invalidate_clip_cache(self):
+        """Invalidate the clip cache and the cached note windows (once, at the end of a note batch)."""
+        if self._note_batch is not None:
+            self._note_batch['invalidate'] = True
+            return
+        super(DrumSequencer, self)._invalidate_clip_cache()
+        self._drop_notes_cache()
+
+    def exit(self):
+        """Exit drum sequencer mode and stop listening to the clip's notes."""
+        super(DrumSequencer, self).exit()
+        self._watch_clip_notes(None)
+        self._release_drum_rack_cache()
 
     def _clear_playhead_column(self, matrix_rows):
         """Restore LEDs for the last highlighted playhead column."""
@@ -453,19 +1046,21 @@ class DrumSequencer(SequencerBase):
         finally:
             self._last_blink_col = None
 
-    def _has_note_overlap_at(self, clip, pitch, start, step_duration):
-        """Detect if a note overlaps a step within a tempo-aware epsilon."""
+    def _has_note_overlap_at(self, clip, pitch, start, step_duration, loop_start=None):
+        """Detect if a note overlaps a step within a tempo-aware epsilon (loop_start: clip.loop_start if already read)."""
         if clip is None:
             return False
 
         try:
             step_duration = float(step_duration)
             epsilon = max(0.001, min(0.02, 0.2 * step_duration))
-            loop_start = float(getattr(clip, 'loop_start', 0.0))
+            if loop_start is None:
+                loop_start = getattr(clip, 'loop_start', 0.0)
+            loop_start = float(loop_start)
             from_time = max(0.0, loop_start + float(start) - epsilon)
             time_span = max(2.0 * epsilon, 0.004)
 
-            if hasattr(clip, 'get_notes_extended'):
+            if self._clip_note_api(clip)[0]:
                 existing = clip.get_notes_extended(int(pitch), 1, from_time, time_span)
             else:
                 existing = clip.get_notes(from_time, int(pitch), time_span, 1)
@@ -474,18 +1069,6 @@ class DrumSequencer(SequencerBase):
             self._log_error("_has_note_overlap_at", exc)
             return False
 
-    def _has_overlap_in_list(self, notes, start, duration):
-        if not notes:
-            return False
-        EPSILON = 1e-5
-        end = start + float(duration)
-        for n in notes:
-            ns = float(n['start'])
-            ne = ns + float(n['duration'])
-            if ns < end - EPSILON and ne > start + EPSILON:
-                return True
-        return False
-
     def _redraw_cell(self, col, row, matrix_rows):
         """Recompute and light a cell based on its note state."""
         if not matrix_rows or not (0 <= row < len(matrix_rows)):
@@ -504,8 +1087,10 @@ class DrumSequencer(SequencerBase):
         if clip is None:
             return
 
+        loop_start = None
         try:
-            clip_loop_len = float(getattr(clip, 'loop_end', 0.0) - getattr(clip, 'loop_start', 0.0))
+            loop_start = getattr(clip, 'loop_start', 0.0)
+            clip_loop_len = float(getattr(clip, 'loop_end', 0.0) - loop_start)
             if clip_loop_len <= 0.0:
                 clip_loop_len = float(self._loop_bars_options[self._loop_bars_index] * 4.0)
         except Exception:
@@ -514,7 +1099,7 @@ class DrumSequencer(SequencerBase):
         if start >= clip_loop_len:
             return
 
-        has_note = self._has_note_overlap_at(clip, pitch, start, note_len)
+        has_note = self._has_note_overlap_at(clip, pitch, start, note_len, loop_start)
 
         if pitch_index == self._selected_drum:
             color = self._LED_GREEN if has_note else self._LED_BLUE
@@ -524,21 +1109,32 @@ class DrumSequencer(SequencerBase):
         self._set_pad_led_color(col, row, color, matrix_rows)
 
     def update_playhead_leds(self, matrix_rows, clip_stop_buttons=None):
-        """Advance the playhead highlight on the grid and clip-stop row."""
+        """Advance the playhead highlight on the grid and clip-stop row, as one LED frame."""
+        self._begin_led_frame()
+        try:
+            self._render_playhead(matrix_rows, clip_stop_buttons)
+        finally:
+            self._end_led_frame(matrix_rows, 'PLAYHEAD')
+    
+    def _render_playhead(self, matrix_rows, clip_stop_buttons=None):
+        """Redraw the trail and playhead columns and the clip-stop page LEDs (see update_playhead_leds)."""
         if not matrix_rows or self._song is None:
             self._log_info("update_playhead_leds: No matrix rows or song")
             return
             
-        # Add time import if not already present
-        try:
-            import time
-        except ImportError:
-            pass
-            
-        # Debug: Log when playhead updates are called
-        if not hasattr(self, '_last_playhead_log') or (time.time() - getattr(self, '_last_playhead_log', 0)) > 1.0:
-            self._log_info(f"update_playhead_leds: Updating playhead (matrix_rows: {len(matrix_rows)} rows)")
-            self._last_playhead_log = time.time()
+        # Debug: Log when playhead updates are called (at most once per second)
+        now = monotonic()
+        if self._last_playhead_log is None or now - self._last_playhead_log > 1.0:
+            self._log_info("update_playhead_leds: Updating playhead (matrix_rows: %d rows)", len(matrix_rows))
+            self._last_playhead_log = now
+
+        # Attributes and bound methods used per pad, read once
+        steps_per_page = self._steps_per_page
+        rows_visible = self._rows_visible
+        visible_pitches = self._visible_pitches()
+        set_pad = self._set_pad_led_color
+        col_mask = self._steps_col_mask
+        page_shift = self._steps_page_shift
 
         try:
             note_len = float(self._note_lengths[self._note_length_index])
@@ -551,41 +1147,54 @@ class DrumSequencer(SequencerBase):
                 self._log_info("update_playhead_leds: No clip available")
                 return
 
+            verbose = self._VERBOSE_PLAYHEAD_LOG
+
+            # Read each clip property once per tick (every read is a Live API call)
+            clip_loop_start = getattr(clip, 'loop_start', None)
+            clip_loop_end = getattr(clip, 'loop_end', None)
+            clip_position = getattr(clip, 'playing_position', None)
+
             # Log clip properties for debugging
-            self._log_info(f"Clip: loop_start={getattr(clip, 'loop_start', 'N/A')}, loop_end={getattr(clip, 'loop_end', 'N/A')}, "
-                          f"playing_position={getattr(clip, 'playing_position', 'N/A')}, "
-                          f"length={getattr(clip, 'length', 'N/A')}")
+            if verbose:
+                self._log_info("Clip: loop_start=%s, loop_end=%s, playing_position=%s, length=%s",
+                               'N/A' if clip_loop_start is None else clip_loop_start,
+                               'N/A' if clip_loop_end is None else clip_loop_end,
+                               'N/A' if clip_position is None else clip_position,
+                               getattr(clip, 'length', 'N/A'))
 
             loop_length = float(self._loop_bars_options[self._loop_bars_index] * 4.0)
-            if hasattr(clip, 'loop_end') and hasattr(clip, 'loop_start'):
-                clip_len = float(clip.loop_end) - float(clip.loop_start)
+            if clip_loop_end is not None and clip_loop_start is not None:
+                clip_len = float(clip_loop_end) - float(clip_loop_start)
                 if clip_len > 0.0:
                     loop_length = clip_len
-                    self._log_info(f"Using clip loop length: {loop_length}")
+                    if verbose:
+                        self._log_info("Using clip loop length: %s", loop_length)
 
             loop_length = max(loop_length, note_len)
-            self._log_info(f"Final loop_length: {loop_length}, note_len: {note_len}")
+            if verbose:
+                self._log_info("Final loop_length: %s, note_len: %s", loop_length, note_len)
 
             song_time = float(getattr(self._song, 'current_song_time', 0.0))
             pos = 0.0
             method = "song_time (fallback)"
 
             # Try to get position using the best available method
-            if hasattr(clip, 'playing_position'):
+            if clip_position is not None:
                 try:
-                    pos = float(clip.playing_position)
+                    pos = float(clip_position)
                     method = "clip.playing_position"
-                    self._log_info(f"Using clip.playing_position: {pos}")
+                    if verbose:
+                        self._log_info("Using clip.playing_position: %s", pos)
                 except Exception as e:
                     self._log_error("Error getting playing_position", e)
                     method = "clip.playing_position failed"
             
-            if method == "clip.playing_position failed" and hasattr(clip, 'loop_start'):
+            if method == "clip.playing_position failed" and clip_loop_start is not None:
                 try:
-                    clip_start = float(clip.loop_start)
+                    clip_start = float(clip_loop_start)
                     pos = (song_time - clip_start) % loop_length
                     method = "song_time - loop_start"
-                    self._log_info(f"Using song_time - loop_start: {pos} (song_time: {song_time}, clip_start: {clip_start})")
+                    self._log_info("Using song_time - loop_start: %s (song_time: %s, clip_start: %s)", pos, song_time, clip_start)
                 except Exception as e:
                     self._log_error("Error calculating pos from loop_start", e)
                     method = "song_time - loop_start failed"
@@ -593,13 +1202,14 @@ class DrumSequencer(SequencerBase):
             if method.endswith("failed"):
                 pos = song_time % loop_length
                 method = "song_time % loop_length"
-                self._log_info(f"Falling back to song_time % loop_length: {pos}")
+                self._log_info("Falling back to song_time %% loop_length: %s", pos)
 
-            self._log_info(f"Final position: {pos} (method: {method})")
+            if verbose:
+                self._log_info("Final position: %s (method: %s)", pos, method)
 
             # Use floor to derive step index to avoid boundary oscillation at very small lengths
             step_idx = int(pos / note_len)
-            col_base = step_idx % self._steps_per_page
+            col_base = step_idx & col_mask
             
             # Check if we're beyond the actual loop length
             if pos >= loop_length:
@@ -609,20 +1219,18 @@ class DrumSequencer(SequencerBase):
                 return
 
             # Honor virtual boundary columns
-            x_off = getattr(self, '_x_boundary_offset', 0)
-            y_off = getattr(self, '_y_boundary_offset', 0)
+            x_off = self._x_boundary_offset
+            y_off = self._y_boundary_offset
 
             # Compute right boundary red column when in right boundary layer
             loop_length = float(loop_length)
-            page_start = self._time_page * self._steps_per_page * note_len
-            last_valid = -1
-            for c in range(self._steps_per_page):
-                if page_start + c * note_len < loop_length:
-                    last_valid = c
-            right_red_col = max(0, min(self._steps_per_page - 1, last_valid + 1))
+            page_start = self._time_page * steps_per_page * note_len
+            page_len = steps_per_page * note_len
+            col_starts = self._column_starts(note_len)
+            right_red_col = self._right_red_col(page_start, note_len, loop_length)
 
             if x_off == -1:
-                col_vis = min(self._steps_per_page - 1, col_base + 1)
+                col_vis = min(steps_per_page - 1, col_base + 1)
                 col_eff = max(0, col_vis - 1)
             elif x_off == 1:
                 col_vis = min(col_base, right_red_col - 1) if right_red_col > 0 else 0
@@ -634,51 +1242,51 @@ class DrumSequencer(SequencerBase):
             # Compute total steps for loop
             total_steps = int(loop_length / note_len) if note_len > 0 else 0
 
+            # Ticks come every ~30 ms but a step usually lasts longer: when the playhead is on the
+            # same step, nothing else has written a pad since the last tick and no trail is fading,
+            # this tick would redraw exactly the same LEDs. The clip stop blink still follows the clock.
+            stop_blink = (int(monotonic() * 2) & 1) if clip_stop_buttons else None
+            render_key = (step_idx, self._time_page, note_len, loop_length, x_off, y_off,
+                          len(matrix_rows), stop_blink)
+            if (render_key == self._playhead_render_key and self._pad_led_writes == self._playhead_led_writes
+                    and not self._last_trail_cols and not any(self._trail_ttls)):
+                return
+            self._playhead_render_key = render_key
+
+            # Rows the column passes below touch (boundary bar rows skipped), worked out once per tick;
+            # content rows are the ones with a drum pad, which column restores redraw
+            bottom_row_idx = min(rows_visible - 1, len(matrix_rows) - 1)
+            grid_rows = []
+            for row in range(min(rows_visible, len(matrix_rows))):
+                if (y_off == -1 and row == 0) or (y_off == 1 and row == bottom_row_idx):
+                    continue
+                grid_rows.append((row, row - 1 if y_off == -1 else row))
+            content_rows = [(row, eff_row) for row, eff_row in grid_rows
+                            if eff_row >= 0 and visible_pitches[eff_row] >= 0]
+            frame = _PlayheadFrame(clip, self._page_cell_colors(clip), matrix_rows, content_rows,
+                                   page_start, page_len, note_len, loop_length, col_starts,
+                                   x_off, y_off, right_red_col)
+
             # Clear previous trail columns (redraw their content) so we don't leave artifacts
             try:
-                prev_trails = getattr(self, '_last_trail_cols', []) or []
-                if prev_trails:
-                    for prev_col in set(prev_trails):
-                        # Redraw previous trail column back to content (skip boundary bars)
-                        for row in range(min(self._rows_visible, len(matrix_rows))):
-                            bottom_row_idx = min(self._rows_visible - 1, len(matrix_rows) - 1)
-                            if (y_off == -1 and row == 0) or (y_off == 1 and row == bottom_row_idx):
-                                continue
-                            # Skip boundary columns
-                            if (x_off == -1 and prev_col == 0) or (x_off == 1 and prev_col >= right_red_col):
-                                continue
-                            eff_row = row - 1 if y_off == -1 else row
-                            eff_col = prev_col - 1 if x_off == -1 else prev_col
-                            if eff_row < 0 or eff_col < 0:
-                                continue
-                            pitch_index = eff_row + self._drum_row_base
-                            if pitch_index < 0 or pitch_index >= len(self._row_note_offsets):
-                                continue
-                            pitch = self._row_note_offsets[pitch_index]
-                            page_len = self._steps_per_page * note_len
-                            notes_for_row = self._collect_notes_for_row(clip, pitch, page_start, page_len)
-                            step_start = page_start + eff_col * note_len
-                            if step_start >= loop_length:
-                                continue
-                            color, pattern, subdivision = self._compute_cell_visual(notes_for_row, step_start, note_len, (pitch_index == self._selected_drum))
-                            if pattern:
-                                self._set_pad_led_color(prev_col, row, pattern[0], matrix_rows)
-                            else:
-                                self._set_pad_led_color(prev_col, row, color, matrix_rows)
+                if self._last_trail_cols:
+                    self._restore_content_columns(set(self._last_trail_cols), frame)
             except Exception as trail_clear_exc:
                 self._log_error("update_playhead_leds(clear_trails)", trail_clear_exc)
 
             # Build and render dim trail so every skipped column is visible at micro lengths
             try:
-                last_step = getattr(self, '_last_step_idx', None)
+                last_step = self._last_step_idx
                 progressed = 0
                 if last_step is not None and total_steps > 0:
                     progressed = (step_idx - last_step) % total_steps
                 micro = (note_len <= 0.125)
-                trail_map = getattr(self, '_playhead_trail_map', {}) if micro else {}
+                trail_ttls = self._trail_ttls
+                if len(trail_ttls) != steps_per_page:
+                    trail_ttls = self._trail_ttls = bytearray(steps_per_page)
                 # Adaptive trail TTL based on tempo and step duration so skipped columns remain visible
                 try:
-                    tempo = float(getattr(self._song, 'tempo', 120.0))
+                    tempo = float(self._song.tempo)
                 except Exception:
                     tempo = 120.0
                 beat_sec = 60.0 / max(1.0, tempo)
@@ -690,48 +1298,51 @@ class DrumSequencer(SequencerBase):
                 if trail_ttl > 3:
                     trail_ttl = 3
                 
-                # Initialize counter before using it
-                try:
-                    ctr = getattr(self, '_clip_stop_tick_ctr', 0) + 1
-                except Exception:
-                    ctr = 1
+                ctr = self._clip_stop_tick_ctr + 1
                 
-                # Always update clip stop buttons to show current page
+                # Clip stop buttons show the loop's pages with the playing page blinking.
+                # The blink follows the clock (toggles every 0.5 s) rather than the tick
+                # rate, and the buttons are only revisited when what they show changed.
                 if clip_stop_buttons:
-                    loop_pages = max(1, (total_steps + self._steps_per_page - 1) // self._steps_per_page)
-                    current_page = step_idx // self._steps_per_page
-                    
-                    # Log clip stop button state for debugging
-                    self._log_info(f"Clip stop buttons - current_page: {current_page}, loop_pages: {loop_pages}, step_idx: {step_idx}, total_steps: {total_steps}")
-                    
-                    # Update clip stop buttons for all note lengths
-                    for idx, btn in enumerate(clip_stop_buttons):
-                        if not btn or not hasattr(btn, 'send_value'):
-                            continue
-                        try:
-                            if idx == current_page:
-                                color = self._LED_PINK if idx == self._time_page else self._LED_RED
-                                btn.send_value(color if self._clip_stop_blink_state else self._LED_OFF, True)
-                            elif idx < loop_pages:
-                                btn.send_value(self._LED_ORANGE, True)
-                            else:
-                                btn.send_value(self._LED_OFF, True)
-                        except Exception as btn_exc:
-                            self._log_error("update_playhead_leds(clip_stop)", btn_exc)
-
-                # Toggle blink state and update counters
-                self._clip_stop_blink_state = not self._clip_stop_blink_state
-                self._last_loop_position_page = step_idx // self._steps_per_page
+                    loop_pages = max(1, (total_steps + steps_per_page - 1) // steps_per_page)
+                    current_page = step_idx >> page_shift
+                    blink_state = int(monotonic() * 2) & 1
+                    self._clip_stop_blink_state = bool(blink_state)
+                    state_key = (current_page, loop_pages, self._time_page, blink_state)
+                    if state_key != self._clip_stop_state_key:
+                        self._clip_stop_state_key = state_key
+                        # Only buttons whose colour changed since the last send are written
+                        clip_stop_shadow = self._clip_stop_led_shadow
+                        for idx, btn in enumerate(clip_stop_buttons):
+                            if not btn or not hasattr(btn, 'send_value'):
+                                continue
+                            try:
+                                if idx == current_page:
+                                    color = self._LED_PINK if idx == self._time_page else self._LED_RED
+                                    if not blink_state:
+                                        color = self._LED_OFF
+                                elif idx < loop_pages:
+                                    color = self._LED_ORANGE
+                                else:
+                                    color = self._LED_OFF
+                                if clip_stop_shadow.get(idx) != color:
+                                    btn.send_value(color, True)
+                                    clip_stop_shadow[idx] = color
+                            except Exception as btn_exc:
+                                self._log_error("update_playhead_leds(clip_stop)", btn_exc)
+
+                # Update counters
+                self._last_loop_position_page = step_idx >> page_shift
                 self._clip_stop_tick_ctr = ctr
                 # Add intermediate columns with a short TTL
                 for i in range(1, progressed):
                     step_i = (last_step + i) % total_steps
-                    step_page = step_i // self._steps_per_page
+                    step_page = step_i >> page_shift
                     if step_page != self._time_page:
                         continue
-                    col_base_i = step_i % self._steps_per_page
+                    col_base_i = step_i & col_mask
                     if x_off == -1:
-                        col_vis_i = min(self._steps_per_page - 1, col_base_i + 1)
+                        col_vis_i = min(steps_per_page - 1, col_base_i + 1)
                         col_eff_i = max(0, col_vis_i - 1)
                     elif x_off == 1:
                         col_vis_i = min(col_base_i, right_red_col - 1) if right_red_col > 0 else 0
@@ -739,157 +1350,63 @@ class DrumSequencer(SequencerBase):
                     else:
                         col_vis_i = col_base_i
                         col_eff_i = col_base_i
-                        trail_map[col_vis_i] = trail_ttl  # hold adaptively (bright trail)
+                        if micro:
+                            trail_ttls[col_vis_i] = trail_ttl  # hold adaptively (bright trail)
 
                 # Render and age trail columns
-                if micro and trail_map:
-                    rows_count = min(self._rows_visible, len(matrix_rows))
+                if micro and any(trail_ttls):
                     clip_for_check = clip if clip is not None else self._get_cached_clip()
                     expired = []
-                    for tcol, ttl in list(trail_map.items()):
+                    for tcol in range(steps_per_page):
+                        ttl = trail_ttls[tcol]
+                        if not ttl:
+                            continue
                         # Skip boundary cols
                         if (x_off == -1 and tcol == 0) or (x_off == 1 and tcol >= right_red_col):
                             expired.append(tcol)
                             continue
-                        for row in range(rows_count):
-                            bottom_row_idx = min(self._rows_visible - 1, len(matrix_rows) - 1)
-                            if (y_off == -1 and row == 0) or (y_off == 1 and row == bottom_row_idx):
-                                continue
-                            eff_row = row - 1 if y_off == -1 else row
-                            if eff_row < 0:
-                                continue
-                            pitch_index = eff_row + self._drum_row_base
-                            if pitch_index >= len(self._row_note_offsets):
-                                continue
-                            step_start_i = (self._time_page * self._steps_per_page + (tcol - 1 if x_off == -1 else tcol)) * note_len
+                        for row, eff_row in content_rows:
+                            step_start_i = (self._time_page * steps_per_page + (tcol - 1 if x_off == -1 else tcol)) * note_len
                             if clip_for_check is not None and step_start_i < loop_length:
-                                pitch = self._row_note_offsets[pitch_index]
-                                cache = getattr(self, '_page_notes_cache', None)
-                                if cache and cache.get('page_start') == page_start and cache.get('page_length') == page_len:
-                                    notes_for_row = cache.get('rows', {}).get(eff_row)
-                                    has_note_i = self._has_overlap_in_list(notes_for_row, step_start_i, note_len)
-                                else:
-                                    has_note_i = self._has_note_overlap_at(clip_for_check, pitch, step_start_i, note_len)
+                                notes_for_row = self._page_row_notes(clip_for_check, eff_row, page_start, page_len)
+                                has_note_i = notes_for_row.overlaps(step_start_i, step_start_i + note_len)
                                 # Bright trail so each skipped column is clearly visible
                                 color_i = self._LED_YELLOW if has_note_i else self._LED_TEAL
-                                try:
-                                    if 0 <= row < len(matrix_rows) and 0 <= tcol < len(matrix_rows[row]):
-                                        btn = matrix_rows[row][tcol]
-                                        if btn and hasattr(btn, 'send_value'):
-                                            btn.send_value(color_i, True)
-                                except Exception:
-                                    self._set_pad_led_color(tcol, row, color_i, matrix_rows)
+                                set_pad(tcol, row, color_i, matrix_rows)
+                                frame.done.discard((tcol, row))
                         # Decrement TTL
                         ttl -= 1
                         if ttl <= 0:
                             expired.append(tcol)
                         else:
-                            trail_map[tcol] = ttl
+                            trail_ttls[tcol] = ttl
 
                     # Redraw expired columns back to content
                     if expired:
+                        self._restore_content_columns(expired, frame)
                         for prev_col in expired:
-                            for row in range(min(self._rows_visible, len(matrix_rows))):
-                                bottom_row_idx = min(self._rows_visible - 1, len(matrix_rows) - 1)
-                                if (y_off == -1 and row == 0) or (y_off == 1 and row == bottom_row_idx):
-                                    continue
-                                if (x_off == -1 and prev_col == 0) or (x_off == 1 and prev_col >= right_red_col):
-                                    continue
-                                eff_row = row - 1 if y_off == -1 else row
-                                eff_col = prev_col - 1 if x_off == -1 else prev_col
-                                if eff_row < 0 or eff_col < 0:
-                                    continue
-                                pitch_index = eff_row + self._drum_row_base
-                                if pitch_index < 0 or pitch_index >= len(self._row_note_offsets):
-                                    continue
-                                pitch = self._row_note_offsets[pitch_index]
-                                page_len = self._steps_per_page * note_len
-                                notes_for_row = None
-                                cache = getattr(self, '_page_notes_cache', None)
-                                if cache and cache.get('page_start') == page_start and cache.get('page_length') == page_len:
-                                    notes_for_row = cache.get('rows', {}).get(eff_row)
-                                if notes_for_row is None:
-                                    notes_for_row = self._collect_notes_for_row(clip, pitch, page_start, page_len)
-                                step_start = page_start + eff_col * note_len
-                                if step_start >= loop_length:
-                                    continue
-                                color, pattern, subdivision = self._compute_cell_visual(notes_for_row, step_start, note_len, (pitch_index == self._selected_drum))
-                                if pattern:
-                                    self._set_pad_led_color(prev_col, row, pattern[0], matrix_rows)
-                                else:
-                                    self._set_pad_led_color(prev_col, row, color, matrix_rows)
-                            try:
-                                trail_map.pop(prev_col, None)
-                            except Exception:
-                                pass
-
-                # Store updated trail map
-                if micro:
-                    self._playhead_trail_map = trail_map
+                            trail_ttls[prev_col] = 0
             except Exception as trail_exc:
                 self._log_error("update_playhead_leds(trail)", trail_exc)
 
             # Current playhead column to display (always the actual current column)
             disp_col_vis, disp_col_eff = col_vis, col_eff
 
-            # Always render the current playhead column in RED
-            for row in range(min(self._rows_visible, len(matrix_rows))):
-                # Skip boundary rows
-                bottom_row_idx = min(self._rows_visible - 1, len(matrix_rows) - 1)
-                if (y_off == -1 and row == 0) or (y_off == 1 and row == bottom_row_idx):
-                    continue
-                
-                # Skip boundary columns
-                if (x_off == -1 and disp_col_vis == 0) or (x_off == 1 and disp_col_vis >= right_red_col):
-                    continue
-                
-                # Set playhead column to RED
-                self._set_pad_led_color(disp_col_vis, row, self._LED_RED, matrix_rows)
-                self._log_info(f"Set playhead LED at col={disp_col_vis}, row={row}")
+            # Always render the current playhead column in RED (unless it sits on a boundary column)
+            if not ((x_off == -1 and disp_col_vis == 0) or (x_off == 1 and disp_col_vis >= right_red_col)):
+                for row, _ in grid_rows:
+                    set_pad(disp_col_vis, row, self._LED_RED, matrix_rows, True)
+                if verbose:
+                    self._log_info("Set playhead LEDs at col=%d (%d rows)", disp_col_vis, len(grid_rows))
 
             if disp_col_vis != self._last_blink_col:
                 if self._last_blink_col is not None:
-                    prev_col = self._last_blink_col
                     # Redraw previous playhead column back to content (skip boundary bars)
-                    for row in range(min(self._rows_visible, len(matrix_rows))):
-                        # Skip boundary rows
-                        bottom_row_idx = min(self._rows_visible - 1, len(matrix_rows) - 1)
-                        if (y_off == -1 and row == 0) or (y_off == 1 and row == bottom_row_idx):
-                            continue
-
-                        # Skip boundary columns
-                        if (x_off == -1 and prev_col == 0) or (x_off == 1 and prev_col >= right_red_col):
-                            continue
-
-                        # Map visible to effective indices
-                        eff_row = row - 1 if y_off == -1 else row
-                        eff_col = prev_col - 1 if x_off == -1 else prev_col
-                        if eff_row < 0 or eff_col < 0:
-                            continue
-
-                        # Recompute content color for this cell
-                        pitch_index = eff_row + self._drum_row_base
-                        if pitch_index < 0 or pitch_index >= len(self._row_note_offsets):
-                            continue
-                        pitch = self._row_note_offsets[pitch_index]
-                        page_len = self._steps_per_page * note_len
-                        notes_for_row = None
-                        cache = getattr(self, '_page_notes_cache', None)
-                        if cache and cache.get('page_start') == page_start and cache.get('page_length') == page_len:
-                            notes_for_row = cache.get('rows', {}).get(eff_row)
-                        if notes_for_row is None:
-                            notes_for_row = self._collect_notes_for_row(clip, pitch, page_start, page_len)
-                        step_start = page_start + eff_col * note_len
-                        if step_start >= loop_length:
-                            continue
-                        color, pattern, subdivision = self._compute_cell_visual(notes_for_row, step_start, note_len, (pitch_index == self._selected_drum))
-                        if pattern:
-                            self._set_pad_led_color(prev_col, row, pattern[0], matrix_rows)
-                        else:
-                            self._set_pad_led_color(prev_col, row, color, matrix_rows)
+                    self._restore_content_columns((self._last_blink_col,), frame)
 
                 self._blink_phase = 0
                 self._last_blink_col = disp_col_vis
+            self._playhead_led_writes = self._pad_led_writes
             if step_idx % 8 == 0:
                 try:
                     self._cs.log_message("Playhead [%s]: pos=%.3f song_time=%.3f step=%d col=%d page=%d note_len=%.3f" % (
@@ -898,7 +1415,7 @@ class DrumSequencer(SequencerBase):
                         song_time,
                         step_idx,
                         col_base,
-                        step_idx // self._steps_per_page,
+                        step_idx // steps_per_page,
                         note_len
                     ))
                 except Exception:
@@ -908,55 +1425,90 @@ class DrumSequencer(SequencerBase):
             self._log_error("update_playhead_leds", exc)
             self._clear_playhead_column(matrix_rows)
 
+    def _restore_content_columns(self, cols, frame):
+        """Redraw visible columns back to content (boundary bars and columns past the loop end are left alone)."""
+        for col in cols:
+            for row, _ in frame.content_rows:
+                self._redraw_content_cell(col, row, frame)
+
+    def _redraw_content_cell(self, vis_col, vis_row, frame):
+        """
+        Redraw one content pad of the playhead tick described by frame (a _PlayheadFrame) with the
+        colour its notes give it. vis_row is one of frame.content_rows; each cell is sent at most
+        once per tick unless an overlay has been drawn on it since.
+        """
+        key = (vis_col, vis_row)
+        if key in frame.done:
+            return
+        frame.done.add(key)
+        x_off = frame.x_off
+        if (x_off == -1 and vis_col == 0) or (x_off == 1 and vis_col >= frame.right_red_col):
+            return
+        eff_col = vis_col - 1 if x_off == -1 else vis_col
+        if eff_col < 0:
+            return
+        step_start = frame.col_starts[eff_col]
+        if step_start >= frame.loop_length:
+            return
+        eff_row = vis_row - 1 if frame.y_off == -1 else vis_row
+        color = self._content_cell_color(frame.clip, frame.cells, eff_row, eff_col, step_start,
+                                         frame.page_start, frame.page_len, frame.note_len)
+        self._set_pad_led_color(vis_col, vis_row, color, frame.matrix_rows)
+
     def _compute_cell_visual(self, notes, column_start, column_length, row_selected):
         """Determine color and blink pattern for a grid cell."""
-        EPSILON = 1e-5
+        EPSILON = _OVERLAP_EPSILON
         column_end = column_start + column_length
 
-        notes_in_cell = [note for note in notes
-                          if note['start'] < column_end - EPSILON
-                          and (note['start'] + note['duration']) > column_start + EPSILON]
+        if not notes.overlaps(column_start, column_end):
+            return (self._LED_BLUE if row_selected else self._LED_OFF), None, 0.0
+
+        # One pass: the (start, duration) of the notes sounding in this cell, in clip
+        # order, and whether any of them covers the whole cell
+        lo = column_start + EPSILON
+        hi = column_end - EPSILON
+        full_length = column_length - EPSILON
+        notes_in_cell = []
+        covered = False
+        for start, duration in zip(notes.note_starts, notes.durations):
+            if start < hi and start + duration > lo:
+                notes_in_cell.append((start, duration))
+                if (start <= lo and start + duration >= hi) or duration >= full_length:
+                    covered = True
 
         if not notes_in_cell:
-            base_color = self._LED_BLUE if row_selected else self._LED_OFF
-            return base_color, None, 0.0
-
-        def _solid_cell_color():
-            mid_time = column_start + (column_length * 0.5)
-            mid_note = self._find_note_covering(notes_in_cell, mid_time)
-            if mid_note:
-                return self.get_color_for_duration(mid_note['duration'])
-            # Fallback: use the longest note in the cell as representative
-            rep_note = max(notes_in_cell, key=lambda n: n['duration'])
-            return self.get_color_for_duration(rep_note['duration'])
+            return (self._LED_BLUE if row_selected else self._LED_OFF), None, 0.0
+
+        # Solid colour: the first note under the middle of the cell, else the longest note in it
+        mid_time = column_start + (column_length * 0.5)
+        for start, duration in notes_in_cell:
+            if start - EPSILON <= mid_time < start + duration + EPSILON:
+                solid_color = self.get_color_for_duration(duration)
+                break
+        else:
+            solid_color = self.get_color_for_duration(max(duration for _, duration in notes_in_cell))
 
         # If any note covers the entire cell (>= cell length), render solid color (no blink)
-        for note in notes_in_cell:
-            note_start = note['start']
-            note_end = note_start + note['duration']
-            if (note_start <= column_start + EPSILON and note_end >= column_end - EPSILON) or (note['duration'] >= column_length - EPSILON):
-                color = _solid_cell_color()
-                return color, None, 0.0
+        if covered:
+            return solid_color, None, 0.0
 
         # Compute if sub-note blinking should occur: only if min note duration < cell length
-        min_dur = min(max(note['duration'], EPSILON) for note in notes_in_cell)
-        if not (min_dur < column_length - EPSILON):
+        min_dur = max(min(duration for _, duration in notes_in_cell), EPSILON)
+        if not (min_dur < full_length):
             # No note smaller than cell: solid color
-            color = _solid_cell_color()
-            return color, None, 0.0
+            return solid_color, None, 0.0
 
         base_duration = max(EPSILON, min(min_dur, column_length))
         subdivisions = int(round(column_length / base_duration))
         subdivisions = max(2, min(16, subdivisions))
 
         if subdivisions <= 1:
-            color = _solid_cell_color()
-            return color, None, 0.0
+            return solid_color, None, 0.0
 
         base_duration = column_length / float(subdivisions)
         pattern = []
         use_full = True
-        base_color = _solid_cell_color()
+        base_color = solid_color
         dim_color = self.get_dim_color(base_color)
 
         # Blink entire cell uniformly (full/dim), independent of exact note coverage,
@@ -968,16 +1520,6 @@ class DrumSequencer(SequencerBase):
 
         return pattern[0], pattern, base_duration
 
-    def _find_note_covering(self, notes, time_point):
-        """Return the first note covering the supplied time."""
-        EPSILON = 1e-5
-        for note in notes:
-            start = note['start'] - EPSILON
-            end = note['start'] + note['duration'] + EPSILON
-            if start <= time_point < end:
-                return note
-        return None
-
     
     # ==================== NOTE OPERATIONS ====================
     
@@ -999,17 +1541,13 @@ class DrumSequencer(SequencerBase):
             page_start = self._time_page * self._steps_per_page * note_len
             loop_length = self._loop_bars_options[self._loop_bars_index] * 4.0
 
-            x_off = getattr(self, '_x_boundary_offset', 0)
-            y_off = getattr(self, '_y_boundary_offset', 0)
+            x_off = self._x_boundary_offset
+            y_off = self._y_boundary_offset
 
             # Compute right boundary red column when in right boundary layer
             right_red_col = None
             if x_off == 1:
-                last_valid = -1
-                for c in range(self._steps_per_page):
-                    if page_start + c * note_len < loop_length:
-                        last_valid = c
-                right_red_col = max(0, min(self._steps_per_page - 1, last_valid + 1))
+                right_red_col = self._right_red_col(page_start, note_len, loop_length)
 
             bottom_row_index = min(self._rows_visible - 1, len(matrix_rows) - 1) if matrix_rows else (self._rows_visible - 1)
 
@@ -1050,7 +1588,8 @@ class DrumSequencer(SequencerBase):
             search_start = max(0.0, start - tolerance)
             search_duration = max(tolerance * 2, 0.001)
             
-            if hasattr(clip, 'get_notes_extended'):
+            has_extended, has_remove_extended, _ = self._clip_note_api(clip)
+            if has_extended:
                 existing = clip.get_notes_extended(pitch, 1, search_start, search_duration)
             else:
                 existing = clip.get_notes(search_start, pitch, search_duration, 1)
@@ -1067,11 +1606,12 @@ class DrumSequencer(SequencerBase):
                     note_time = note[1]
                     note_duration = note[2]
                 
-                if hasattr(clip, 'remove_notes_extended'):
+                if has_remove_extended:
                     clip.remove_notes_extended(note_pitch, 1, note_time, note_duration)
                 else:
                     clip.remove_notes(note_time, note_pitch, note_duration, 1)
                 
+                self._drop_notes_cache()
                 self._log_debug("Removed note: pitch=%d time=%.3f" % (pitch, start))
                 
                 # Update LED
@@ -1083,21 +1623,9 @@ class DrumSequencer(SequencerBase):
                 velocity = self._drum_velocity[row_offset]
                 mute = False
                 
-                # Create note using Live 12 API
-                if hasattr(clip, 'add_new_notes'):
-                    # Live 12 API - requires MidiNoteSpecification
-                    note_spec = Live.Clip.MidiNoteSpecification(
-                        pitch=int(pitch),
-                        start_time=float(start),
-                        duration=float(note_len),
-                        velocity=int(velocity),
-                        mute=False
-                    )
-                    clip.add_new_notes((note_spec,))
-                else:
-                    # Old API fallback
-                    clip.set_notes(((pitch, start, note_len, velocity, mute),))
+                self._add_notes(clip, ((pitch, start, note_len, velocity, mute),))
                 
+                self._drop_notes_cache()
                 self._log_debug("Added note: pitch=%d time=%.3f vel=%d" % (pitch, start, velocity))
                 
                 # Update LED
@@ -1118,26 +1646,10 @@ class DrumSequencer(SequencerBase):
         Returns:
             int: New function ID
         """
-        functions = [
-            self._FUNCTION_NONE,
-            self._FUNCTION_CLEAR,
-            self._FUNCTION_COPY,
-            self._FUNCTION_PASTE,
-            self._FUNCTION_MPE,
-            self._FUNCTION_FILL_QUARTER,
-            self._FUNCTION_FILL_EIGHTH,
-            self._FUNCTION_FILL_SIXTEENTH,
-            self._FUNCTION_FILL_WHOLE,
-            self._FUNCTION_QUANT_TRIPLET,
-            self._FUNCTION_QUANT_SEPTUPLET
-        ]
-        
         try:
-            current_index = functions.index(self._current_function)
-            next_index = (current_index + 1) % len(functions)
-            self._current_function = functions[next_index]
+            self._current_function = _FUNCTION_NEXT[self._current_function]
             
-            func_name = self._function_names.get(self._current_function, "UNKNOWN")
+            func_name = self._function_name(self._current_function)
             self._log_info("Function cycled to: %s" % func_name)
             
             return self._current_function
@@ -1168,37 +1680,15 @@ class DrumSequencer(SequencerBase):
             # Get current function for this drum
             current = self._drum_functions[absolute_index]
             
-            # Function cycle order
-            functions = [
-                self._FUNCTION_NONE,
-                self._FUNCTION_CLEAR,
-                self._FUNCTION_COPY,
-                self._FUNCTION_PASTE,
-                self._FUNCTION_MPE,
-                self._FUNCTION_FILL_QUARTER,
-                self._FUNCTION_FILL_EIGHTH,
-                self._FUNCTION_FILL_SIXTEENTH,
-                self._FUNCTION_FILL_WHOLE,
-                self._FUNCTION_QUANT_TRIPLET,
-                self._FUNCTION_QUANT_SEPTUPLET
-            ]
-            
-            # Find current index and cycle to next
-            try:
-                current_index = functions.index(current)
-            except ValueError:
-                current_index = 0
-            
-            next_index = (current_index + 1) % len(functions)
-            new_function = functions[next_index]
+            # Next function in the cycle (an unknown id restarts it after NONE)
+            new_function = _FUNCTION_NEXT.get(current, _FUNCTION_CYCLE[1])
             
             # Update drum function
             self._drum_functions[absolute_index] = new_function
             
             # Log the change
-            func_name = self._function_names.get(new_function, "UNKNOWN")
-            self._log_info("Drum %d function changed: %d -> %d (%s)" % (absolute_index, current, new_function, func_name))
-            self._cs.log_message("Drum %d function cycled to: %s (func=%d)" % (absolute_index, func_name, new_function))
+            func_name = self._function_name(new_function)
+            self._log_info("Drum %d function changed: %d -> %d (%s)", absolute_index, current, new_function, func_name)
 
         except Exception as e:
             self._log_error("toggle_drum_function", e)
@@ -1212,42 +1702,47 @@ class DrumSequencer(SequencerBase):
         """
         try:
             # Find all drums with current function assigned
-            target_drums = []
-            for i, func in enumerate(self._drum_functions):
-                if func == self._current_function and func != self._FUNCTION_NONE:
-                    target_drums.append(i)
+            current = self._current_function
+            if current == _FUNCTION_NONE:
+                target_drums = []
+            else:
+                target_drums = [i for i, func in enumerate(self._drum_functions) if func == current]
             
             if not target_drums:
                 self._log_info("No drums assigned to current function")
                 return 0
             
-            func_name = self._function_names.get(self._current_function, "UNKNOWN")
+            func_name = self._function_name(self._current_function)
             self._log_info("Executing %s on %d drums" % (func_name, len(target_drums)))
             
-            # Execute function on each drum
-            for drum_idx in target_drums:
-                if self._current_function == self._FUNCTION_CLEAR:
-                    self._clear_drum_notes(drum_idx)
-                elif self._current_function == self._FUNCTION_COPY:
-                    self._copy_drum_notes(drum_idx)
-                elif self._current_function == self._FUNCTION_PASTE:
-                    self._paste_drum_notes(drum_idx)
-                elif self._current_function == self._FUNCTION_FILL_QUARTER:
-                    self._fill_drum_notes(drum_idx, 1.0)
-                elif self._current_function == self._FUNCTION_FILL_EIGHTH:
-                    self._fill_drum_notes(drum_idx, 0.5)
-                elif self._current_function == self._FUNCTION_FILL_SIXTEENTH:
-                    self._fill_drum_notes(drum_idx, 0.25)
-                elif self._current_function == self._FUNCTION_FILL_WHOLE:
-                    self._fill_drum_notes(drum_idx, 4.0)
-                elif self._current_function == self._FUNCTION_QUANT_TRIPLET:
-                    self._quantize_drum_notes(drum_idx, 3)
-                elif self._current_function == self._FUNCTION_QUANT_SEPTUPLET:
-                    self._quantize_drum_notes(drum_idx, 7)
+            # Execute function on each drum; the clip is edited once, after the last drum
+            self._begin_note_batch()
+            try:
+                for drum_idx in target_drums:
+                    if self._current_function == _FUNCTION_CLEAR:
+                        self._clear_drum_notes(drum_idx)
+                    elif self._current_function == _FUNCTION_COPY:
+                        self._copy_drum_notes(drum_idx)
+                    elif self._current_function == _FUNCTION_PASTE:
+                        self._paste_drum_notes(drum_idx)
+                    elif self._current_function == _FUNCTION_FILL_QUARTER:
+                        self._fill_drum_notes(drum_idx, 1.0)
+                    elif self._current_function == _FUNCTION_FILL_EIGHTH:
+                        self._fill_drum_notes(drum_idx, 0.5)
+                    elif self._current_function == _FUNCTION_FILL_SIXTEENTH:
+                        self._fill_drum_notes(drum_idx, 0.25)
+                    elif self._current_function == _FUNCTION_FILL_WHOLE:
+                        self._fill_drum_notes(drum_idx, 4.0)
+                    elif self._current_function == _FUNCTION_QUANT_TRIPLET:
+                        self._quantize_drum_notes(drum_idx, 3)
+                    elif self._current_function == _FUNCTION_QUANT_SEPTUPLET:
+                        self._quantize_drum_notes(drum_idx, 7)
+            finally:
+                self._end_note_batch()
             
             # Clear assignments after execution
             for drum_idx in target_drums:
-                self._drum_functions[drum_idx] = self._FUNCTION_NONE
+                self._drum_functions[drum_idx] = _FUNCTION_NONE
             
             return len(target_drums)
             
@@ -1258,19 +1753,12 @@ class DrumSequencer(SequencerBase):
     def _quantize_drum_notes(self, drum_index, division):
         """Quantize notes on a drum to triplets/septuplets."""
         try:
-            if drum_index < 0 or drum_index >= len(self._row_note_offsets):
-                return
-
-            pitch = self._row_note_offsets[drum_index]
-            clip = self._ensure_clip()
-            if clip is None:
+            resolved = self._resolve_drum(drum_index)
+            if resolved is None:
                 return
+            pitch, clip = resolved
 
-            if hasattr(clip, 'get_notes_extended'):
-                notes = clip.get_notes_extended(pitch, 1, 0.0, clip.length)
-            else:
-                notes = clip.get_notes(0.0, pitch, clip.length, 1)
-
+            notes = self._snapshot_notes(clip, pitch)
             if not notes:
                 self._cs.log_message("QUANT: Drum %d has no notes" % drum_index)
                 return
@@ -1278,45 +1766,32 @@ class DrumSequencer(SequencerBase):
             note_len = self._note_lengths[self._note_length_index]
             base_step = note_len / division
 
-            new_notes = []
-            for note in notes:
-                if hasattr(note, 'start_time'):
-                    start = float(note.start_time)
-                    duration = float(getattr(note, 'duration', 0.0))
-                    velocity = int(getattr(note, 'velocity', 100))
-                    mute = bool(getattr(note, 'mute', False))
-                else:
-                    start = float(note[1])
-                    duration = float(note[2])
-                    velocity = int(note[3]) if len(note) > 3 else 100
-                    mute = bool(note[4]) if len(note) > 4 else False
-
-                quantized_start = round(start / base_step) * base_step
-                quantized_duration = round(duration / base_step) * base_step
-                quantized_duration = max(base_step, quantized_duration)
-
-                note_spec = Live.Clip.MidiNoteSpecification(
-                    pitch=int(pitch),
-                    start_time=float(quantized_start),
-                    duration=float(quantized_duration),
-                    velocity=int(velocity),
-                    mute=bool(mute)
-                )
-                new_notes.append(note_spec)
-
-            if hasattr(clip, 'remove_notes_extended'):
-                clip.remove_notes_extended(pitch, 1, 0.0, clip.length)
-            else:
-                clip.remove_notes(0.0, pitch, clip.length, 1)
+            # Snap whole columns at once to integer step indices: multiply by the inverse step
+            # and round half up (a note halfway between two steps moves to the later one)
+            starts, durations, velocities, mutes = zip(*notes)
+            inv_step = 1.0 / base_step
+            floor = math.floor
+            start_steps = [floor(start * inv_step + 0.5) for start in starts]
+            length_steps = [floor(duration * inv_step + 0.5) for duration in durations]
+
+            # Notes that snap onto the same step collapse into the first one (in clip order)
+            quantized = {}
+            for step, steps, velocity, mute in zip(start_steps, length_steps, velocities, mutes):
+                if step not in quantized:
+                    quantized[step] = (pitch, step * base_step, max(1, steps) * base_step, velocity, mute)
+            new_notes = list(quantized.values())
+
+            # Already on the grid (nothing moved, nothing collapsed): leave the clip alone.
+            # With no collapse, new_notes is in the same clip order as notes.
+            if len(new_notes) == len(notes) and all(
+                    new[1] == old[0] and new[2] == old[1] for new, old in zip(new_notes, notes)):
+                self._cs.log_message("QUANT: Drum %d already on the grid" % drum_index)
+                return
 
-            if hasattr(clip, 'add_new_notes'):
-                clip.add_new_notes(tuple(new_notes))
-            else:
-                old_notes = [(n.pitch, n.start_time, n.duration, n.velocity, n.mute) for n in new_notes]
-                clip.set_notes(tuple(old_notes))
+            self._remove_pitch_notes(clip, pitch)
+            self._add_notes(clip, new_notes)
 
-            self._log_info("Quantized drum %d to division %d" % (drum_index, division))
-            self._cs.log_message("QUANT: Drum %d quantized to division %d" % (drum_index, division))
+            self._log_info("QUANT: Drum %d quantized to division %d", drum_index, division)
             self._invalidate_clip_cache()
 
         except Exception as e:
@@ -1326,30 +1801,19 @@ class DrumSequencer(SequencerBase):
     def _clear_drum_notes(self, drum_index):
         """Clear all notes for a specific drum."""
         try:
-            if drum_index < 0 or drum_index >= len(self._row_note_offsets):
-                return
-            
-            pitch = self._row_note_offsets[drum_index]
-            clip = self._ensure_clip()
-            if clip is None:
+            resolved = self._resolve_drum(drum_index)
+            if resolved is None:
                 return
+            pitch, clip = resolved
             
             # Get all notes for this pitch
-            if hasattr(clip, 'get_notes_extended'):
-                notes = clip.get_notes_extended(pitch, 1, 0.0, clip.length)
-            else:
-                notes = clip.get_notes(0.0, pitch, clip.length, 1)
+            notes = self._snapshot_notes(clip, pitch)
             
-            if notes and len(notes) > 0:
+            if notes:
                 # Remove all notes
-                if hasattr(clip, 'remove_notes_extended'):
-                    clip.remove_notes_extended(pitch, 1, 0.0, clip.length)
-                else:
-                    clip.remove_notes(0.0, pitch, clip.length, 1)
+                self._remove_pitch_notes(clip, pitch)
                 
-                self._log_info("Cleared %d notes from drum %d (pitch %d)" % 
-                             (len(notes), drum_index, pitch))
-                self._cs.log_message("CLEAR: Removed %d notes from drum %d" % (len(notes), drum_index))
+                self._log_info("CLEAR: Removed %d notes from drum %d (pitch %d)", len(notes), drum_index, pitch)
                 
                 # Invalidate clip cache so refresh_grid gets updated data
                 self._invalidate_clip_cache()
@@ -1362,23 +1826,17 @@ class DrumSequencer(SequencerBase):
     def _copy_drum_notes(self, drum_index):
         """Copy all notes from a specific drum to buffer."""
         try:
-            if drum_index < 0 or drum_index >= len(self._row_note_offsets):
-                return
-            
-            pitch = self._row_note_offsets[drum_index]
-            clip = self._ensure_clip()
-            if clip is None:
+            resolved = self._resolve_drum(drum_index)
+            if resolved is None:
                 return
+            pitch, clip = resolved
             
             # Get all notes for this pitch
-            if hasattr(clip, 'get_notes_extended'):
-                notes = clip.get_notes_extended(pitch, 1, 0.0, clip.length)
-            else:
-                notes = clip.get_notes(0.0, pitch, clip.length, 1)
+            notes = self._snapshot_notes(clip, pitch)
             
-            if notes and len(notes) > 0:
-                # Store notes in buffer
-                self._copied_notes = list(notes)
+            if notes:
+                # Store (start, duration, velocity, mute) tuples in buffer
+                self._copied_notes = notes
                 self._log_info("Copied %d notes from drum %d (pitch %d)" % 
                              (len(notes), drum_index, pitch))
             else:
@@ -1394,44 +1852,17 @@ class DrumSequencer(SequencerBase):
                 self._log_info("No notes in copy buffer")
                 return
             
-            if drum_index < 0 or drum_index >= len(self._row_note_offsets):
-                return
-            
-            target_pitch = self._row_note_offsets[drum_index]
-            clip = self._ensure_clip()
-            if clip is None:
+            resolved = self._resolve_drum(drum_index)
+            if resolved is None:
                 return
+            target_pitch, clip = resolved
             
-            # Create new notes with target pitch using Live 12 API
-            new_notes = []
-            for note in self._copied_notes:
-                if hasattr(note, 'pitch'):
-                    # Live 11+ MidiNote object
-                    note_spec = Live.Clip.MidiNoteSpecification(
-                        pitch=int(target_pitch),
-                        start_time=float(note.start_time),
-                        duration=float(note.duration),
-                        velocity=int(note.velocity),
-                        mute=bool(note.mute) if hasattr(note, 'mute') else False
-                    )
-                else:
-                    # Old API tuple
-                    note_spec = Live.Clip.MidiNoteSpecification(
-                        pitch=int(target_pitch),
-                        start_time=float(note[1]),
-                        duration=float(note[2]),
-                        velocity=int(note[3]),
-                        mute=bool(note[4]) if len(note) > 4 else False
-                    )
-                new_notes.append(note_spec)
+            # Copied notes moved to the target pitch
+            new_notes = [(target_pitch, start, duration, velocity, mute)
+                         for start, duration, velocity, mute in self._copied_notes]
             
             # Add notes to clip
-            if hasattr(clip, 'add_new_notes'):
-                clip.add_new_notes(tuple(new_notes))
-            else:
-                # Old API fallback
-                old_notes = [(n.pitch, n.start_time, n.duration, n.velocity, n.mute) for n in new_notes]
-                clip.set_notes(tuple(old_notes))
+            self._add_notes(clip, new_notes)
             
             self._log_info("Pasted %d notes to drum %d (pitch %d)" % 
                          (len(new_notes), drum_index, target_pitch))
@@ -1445,40 +1876,29 @@ class DrumSequencer(SequencerBase):
     def _fill_drum_notes(self, drum_index, note_duration):
         """Fill a drum with notes at regular intervals."""
         try:
-            if drum_index < 0 or drum_index >= len(self._row_note_offsets):
-                return
-            
-            pitch = self._row_note_offsets[drum_index]
-            clip = self._ensure_clip()
-            if clip is None:
+            resolved = self._resolve_drum(drum_index)
+            if resolved is None:
                 return
+            pitch, clip = resolved
             
             # Get loop length
             loop_length = self._loop_bars_options[self._loop_bars_index] * 4.0
             
-            # Generate notes using Live 12 API
-            new_notes = []
-            time = 0.0
-            velocity = self._drum_velocity[drum_index]
+            if note_duration <= 0:
+                return
             
-            while time < loop_length:
-                note_spec = Live.Clip.MidiNoteSpecification(
-                    pitch=int(pitch),
-                    start_time=float(time),
-                    duration=float(note_duration),
-                    velocity=int(velocity),
-                    mute=False
-                )
-                new_notes.append(note_spec)
-                time += note_duration
+            # Generate notes: start i * duration rather than a running sum, so starts don't drift.
+            # Fields are coerced once here, so the legacy set_notes tuples match the spec path.
+            pitch = int(pitch)
+            note_duration = float(note_duration)
+            velocity = int(self._drum_velocity[drum_index])
+            count = int(math.ceil(loop_length / note_duration))
+            new_notes = [(pitch, start, note_duration, velocity, False)
+                         for start in (i * note_duration for i in range(count))
+                         if start < loop_length]
             
             # Add notes to clip
-            if hasattr(clip, 'add_new_notes'):
-                clip.add_new_notes(tuple(new_notes))
-            else:
-                # Old API fallback
-                old_notes = [(pitch, time, note_duration, velocity, False) for n in new_notes]
-                clip.set_notes(tuple(old_notes))
+            self._add_notes(clip, new_notes)
             
             self._log_info("Filled drum %d with %d notes (duration=%.2f)" % 
                          (drum_index, len(new_notes), note_duration))
@@ -1497,39 +1917,83 @@ class DrumSequencer(SequencerBase):
             scene_launch_buttons: List of scene launch buttons
         """
         try:
-            self._log_info("Rendering scene LEDs for %d buttons" % len(scene_launch_buttons))
-            self._cs.log_message("Rendering scene LEDs for %d buttons" % len(scene_launch_buttons))
-            
-            for i, btn in enumerate(scene_launch_buttons):
-                absolute_index = self._visible_to_absolute_drum(i)
-                if absolute_index is None or absolute_index >= len(self._drum_functions):
-                    self._log_info("Button %d: Out of range" % i)
-                    continue
-                
-                func = self._drum_functions[absolute_index]
-                color = self._function_colors.get(func, self._LED_OFF)
-                
-                self._log_info("Button %d (drum %d): func=%d, color=%d" % (i, absolute_index, func, color))
-                self._cs.log_message("Button %d (drum %d): func=%d, color=%d" % (i, absolute_index, func, color))
-                
-                if btn and hasattr(btn, 'send_value'):
-                    btn.send_value(color, True)  # True = force LED update
-                    self._log_info("Button %d: LED set to color %d" % (i, color))
-                    self._cs.log_message("Button %d: LED set to color %d (FORCED)" % (i, color))
-                else:
-                    self._log_info("Button %d: No send_value method!" % i)
-                    self._cs.log_message("Button %d: No send_value method!" % i)
+            if self._VERBOSE_SCENE_LED_LOG:
+                self._log_info("Rendering scene LEDs for %d buttons", len(scene_launch_buttons))
+            colors = self._render_scene_leds(scene_launch_buttons)
+            self._log_info("Scene function LEDs: %s", colors)
                     
         except Exception as e:
             self._log_error("render_scene_function_leds", e)
     
+    def _render_scene_leds(self, scene_launch_buttons, override_color=None):
+        """
+        Send each scene launch button its drum's function colour, or override_color to all
+        of them (scene preview), skipping buttons that already show it. The changed buttons
+        are written as one burst of note-ons.
+        
+        Returns:
+            list: Colour per button (None for a button past the drum list without an override)
+        """
+        verbose = self._VERBOSE_SCENE_LED_LOG and override_color is None
+        
+        # Read once for the whole row of buttons
+        drum_functions = self._drum_functions
+        function_colors = self._function_colors
+        scene_shadow = self._scene_led_shadow
+        visible_drums = self._visible_drums(len(scene_launch_buttons))
+        colors = []
+        pending = []
+        for i, btn in enumerate(scene_launch_buttons):
+            if override_color is not None:
+                color = override_color
+            else:
+                absolute_index = visible_drums[i]
+                if absolute_index is None:
+                    if verbose:
+                        self._log_info("Button %d: Out of range", i)
+                    colors.append(None)
+                    continue
+                
+                func = drum_functions[absolute_index]
+                color = function_colors[func]
+                if verbose:
+                    self._log_info("Button %d (drum %d): func=%d, color=%d", i, absolute_index, func, color)
+            colors.append(color)
+            
+            if btn and hasattr(btn, 'send_value'):
+                if scene_shadow.get(i) != color:
+                    pending.append((i, btn, color))
+            elif verbose:
+                self._log_info("Button %d: No send_value method!", i)
+        
+        if pending:
+            # The surface queues the note-ons and writes them out together (the APC40 mkII
+            # protocol has no multi-LED message to pack them into)
+            with self._cs.accumulating_midi_messages():
+                for i, btn, color in pending:
+                    btn.send_value(color, True)  # True = force LED update
+                    scene_shadow[i] = color
+        return colors
+    
+    def _function_color(self, func):
+        """LED colour for a function id (dark for unknown ids)."""
+        if 0 <= func < len(self._function_colors):
+            return self._function_colors[func]
+        return self._LED_OFF
+    
+    def _function_name(self, func):
+        """Log name for a function id."""
+        if 0 <= func < len(_FUNCTION_NAMES):
+            return _FUNCTION_NAMES[func]
+        return "UNKNOWN"
+    
     def get_current_function_color(self):
         """Get the color for the currently selected function."""
-        return self._function_colors.get(self._current_function, self._LED_OFF)
+        return self._function_color(self._current_function)
     
     def get_current_function_name(self):
         """Get the name of the currently selected function."""
-        return self._function_names.get(self._current_function, "UNKNOWN")
+        return self._function_name(self._current_function)
     
     def start_scene_preview(self, function_color):
         """
@@ -1541,6 +2005,7 @@ class DrumSequencer(SequencerBase):
         self._scene_preview_active = True
         self._scene_preview_color = function_color
         self._scene_preview_count = 0
+        self._scene_led_shadow = {}  # A new preview resends every button
         self._cs.log_message("Scene preview started: color=%d" % function_color)
     
     def update_scene_preview(self, scene_launch_buttons):
@@ -1560,20 +2025,19 @@ class DrumSequencer(SequencerBase):
             # Increment blink count
             self._scene_preview_count += 1
             
-            # Flash all scene buttons in the preview color (no OFF phase for faster feedback)
-            for btn in scene_launch_buttons:
-                if btn and hasattr(btn, 'send_value'):
-                    btn.send_value(self._scene_preview_color, True)
-            
             # Check if preview is complete (~1 second at 90ms/tick)
             if self._scene_preview_count >= self._scene_preview_target:
                 self._scene_preview_active = False
                 self._cs.log_message("Scene preview complete")
                 
-                # Restore individual drum function LEDs
+                # Restore individual drum function LEDs (the last tick goes straight back to
+                # them instead of showing the preview colour first)
                 self.render_scene_function_leds(scene_launch_buttons)
                 return False
             
+            # Flash all scene buttons in the preview color (no OFF phase for faster feedback);
+            # after the first tick they already show it, so only changed buttons are sent
+            self._render_scene_leds(scene_launch_buttons, self._scene_preview_color)
             return True
             
         except Exception as e:
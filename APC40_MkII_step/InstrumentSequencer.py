@@ -2,6 +2,12 @@ from __future__ import absolute_import, print_function, unicode_literals
 import Live
 from .SequencerBase import SequencerBase
 
+# Live 11+ note spec class, bound once; None on older Live, where notes go through set_notes
+try:
+    _MidiNoteSpecification = Live.Clip.MidiNoteSpecification
+except AttributeError:
+    _MidiNoteSpecification = None
+
 class InstrumentSequencer(SequencerBase):
     """
     Melodic instrument sequencer functionality.
@@ -335,9 +341,9 @@ class InstrumentSequencer(SequencerBase):
                 mute = False
                 
                 # Create note using Live 12 API
-                if hasattr(clip, 'add_new_notes'):
+                if _MidiNoteSpecification is not None and hasattr(clip, 'add_new_notes'):
                     # Live 12 API - requires MidiNoteSpecification
-                    note_spec = Live.Clip.MidiNoteSpecification(
+                    note_spec = _MidiNoteSpecification(
                         pitch=int(pitch),
                         start_time=float(start),
                         duration=float(note_len),
@@ -8,6 +8,11 @@ class SequencerBase(object):
     Contains shared functionality like LED management, clip access, and common utilities.
     """
     
+    # Most pads a playhead tick frame sends (3-byte note-ons, ~30 ms apart): keeps a tick's
+    # LED traffic under what a 31.25 kbaud MIDI link carries in that time. Urgent pads
+    # (the playhead column) always go out; the rest wait for the next frame.
+    _TICK_LED_BUDGET = 24
+    
     def __init__(self, control_surface, song, logger=None):
         """
         Initialize the base sequencer with common dependencies.
@@ -40,9 +45,25 @@ class SequencerBase(object):
         self._LED_PEACH = 53
         self._LED_LIGHT_BLUE = 55
         
+        # Pad LED shadow: last colour sent per (col, row); an open frame defers sends until flushed
+        self._pad_led_shadow = {}
+        self._pad_led_frame = None
+        self._pad_led_frame_depth = 0
+        # Pads written urgent in the open frame, and pads a budgeted frame held back for the next one
+        self._pad_led_frame_urgent = set()
+        self._pad_led_deferred = {}
+        # Bound send_value per pad for the matrix_rows last seen (see _pad_senders)
+        self._pad_senders_rows = None
+        self._pad_senders_cache = []
+        # Bumped on every pad write and shadow reset, so callers can tell whether anything touched the grid
+        self._pad_led_writes = 0
+        
         # Common sequencer state
         self._mode = False
         self._steps_per_page = 8
+        # steps_per_page must be a power of two: step -> column/page uses these instead of % and //
+        self._steps_col_mask = self._steps_per_page - 1
+        self._steps_page_shift = self._steps_per_page.bit_length() - 1
         self._rows_visible = 5
         self._time_page = 0
         self._drum_row_base = 11  # Start at bottom (showing lowest notes: indices 11-15 = notes 36-40)
@@ -224,7 +245,7 @@ class SequencerBase(object):
     
     # ==================== LED MANAGEMENT ====================
     
-    def _set_pad_led_color(self, col, row, color_value, matrix_rows):
+    def _set_pad_led_color(self, col, row, color_value, matrix_rows, urgent=False):
         """
         Set a specific pad LED to a color value.
         
@@ -233,15 +254,172 @@ class SequencerBase(object):
             row: Row index (0-4)
             color_value: LED color value from palette
             matrix_rows: The matrix button rows
+            urgent: Send even when the frame's LED budget is spent (see _end_led_frame)
         """
         try:
-            if 0 <= row < len(matrix_rows) and 0 <= col < len(matrix_rows[row]):
-                btn = matrix_rows[row][col]
-                if btn and hasattr(btn, 'send_value'):
-                    btn.send_value(color_value)
+            self._pad_led_writes += 1
+            if self._pad_led_frame is not None:
+                self._pad_led_frame[(col, row)] = color_value
+                if urgent:
+                    self._pad_led_frame_urgent.add((col, row))
+                return
+            if self._pad_led_deferred:
+                self._pad_led_deferred.pop((col, row), None)
+            if self._pad_led_shadow.get((col, row)) == color_value:
+                return
+            senders = self._pad_senders(matrix_rows)
+            if 0 <= row < len(senders) and 0 <= col < len(senders[row]):
+                send_value = senders[row][col]
+                if send_value is not None:
+                    send_value(color_value)
+                    self._pad_led_shadow[(col, row)] = color_value
         except Exception as e:
             self._log_error("_set_pad_led_color", e)
     
+    def _pad_senders(self, matrix_rows):
+        """
+        Each pad's bound send_value (None for a missing pad), built once per
+        matrix_rows object instead of probing the button on every write.
+        """
+        if matrix_rows is not self._pad_senders_rows:
+            self._pad_senders_rows = matrix_rows
+            self._pad_senders_cache = [[getattr(btn, 'send_value', None) if btn else None for btn in row]
+                                       for row in matrix_rows]
+        return self._pad_senders_cache
+    
+    def _begin_led_frame(self):
+        """Start collecting pad LED writes; nothing is sent until the outermost _end_led_frame."""
+        if self._pad_led_frame is None:
+            self._pad_led_frame = {}
+        self._pad_led_frame_depth += 1
+    
+    def _end_led_frame(self, matrix_rows, log_category='GRID_REFRESH', budget=None):
+        """
+        Send the final colour of each pad written during the frame, skipping
+        pads whose last sent colour already matches. Pads a previous budgeted
+        frame held back are sent with it unless the frame wrote them again.
+        
+        Args:
+            matrix_rows: The matrix button rows
+            log_category: Logger category for the frame summary (ticks use TIMING)
+            budget: Most pads to send; urgent pads go first and always, the
+                    others past the budget are held back for the next frame
+        
+        Returns:
+            Number of pads actually sent (0 while an outer frame is still open)
+        """
+        if self._pad_led_frame_depth > 1:
+            self._pad_led_frame_depth -= 1
+            return 0
+        self._pad_led_frame_depth = 0
+        frame = self._pad_led_frame
+        self._pad_led_frame = None
+        urgent = self._pad_led_frame_urgent
+        self._pad_led_frame_urgent = set()
+        if self._pad_led_deferred:
+            if frame:
+                self._pad_led_deferred.update(frame)
+            frame = self._pad_led_deferred
+            self._pad_led_deferred = {}
+        if not frame:
+            return 0
+        # (pad, colour) pairs the shadow doesn't already hold; the items-view difference
+        # compares the whole frame against the shadow in one C-level pass
+        shadow = self._pad_led_shadow
+        changed = frame.items() - shadow.items()
+        held = 0
+        if budget is not None and len(changed) > budget:
+            first = [item for item in changed if item[0] in urgent]
+            rest = [item for item in changed if item[0] not in urgent]
+            room = max(0, budget - len(first))
+            self._pad_led_deferred = dict(rest[room:])
+            held = len(self._pad_led_deferred)
+            changed = first + rest[:room]
+        # Send the changed pads in one pass over the bound senders (no per-pad frame/shadow checks)
+        senders = self._pad_senders(matrix_rows)
+        rows = len(senders)
+        for pad, color_value in changed:
+            col, row = pad
+            try:
+                if 0 <= row < rows and 0 <= col < len(senders[row]):
+                    send_value = senders[row][col]
+                    if send_value is not None:
+                        send_value(color_value)
+                        shadow[pad] = color_value
+            except Exception as e:
+                self._log_error("_end_led_frame", e)
+        sent = len(changed)
+        if held:
+            self._logger.log(log_category, "LED frame: %d/%d pads sent, %d held for the next frame", sent, len(frame), held)
+        else:
+            self._logger.log(log_category, "LED frame: %d/%d pads sent", sent, len(frame))
+        return sent
+    
+    def _flush_led_frame(self, color_rows, matrix_rows):
+        """
+        Write a whole composed grid in one frame, sending only pads whose
+        colour changed (joins the enclosing frame if one is open).
+        
+        Args:
+            color_rows: Colour rows, row 0 first, one colour per column
+            matrix_rows: The matrix button rows
+        
+        Returns:
+            Number of pads actually sent
+        """
+        self._begin_led_frame()
+        try:
+            self._pad_led_writes += 1
+            frame = self._pad_led_frame
+            for row, row_colors in enumerate(color_rows):
+                for col, color_value in enumerate(row_colors):
+                    frame[(col, row)] = color_value
+        finally:
+            sent = self._end_led_frame(matrix_rows)
+        return sent
+    
+    def _set_row_leds(self, row, colors, matrix_rows):
+        """
+        Set pads (0, row), (1, row), ... to colors as one frame write.
+        
+        Args:
+            row: Row index
+            colors: One colour per column, starting at column 0
+            matrix_rows: The matrix button rows
+        """
+        self._begin_led_frame()
+        try:
+            self._pad_led_writes += 1
+            frame = self._pad_led_frame
+            for col, color_value in enumerate(colors):
+                frame[(col, row)] = color_value
+        finally:
+            self._end_led_frame(matrix_rows)
+    
+    def _set_column_leds(self, col, colors, matrix_rows):
+        """
+        Set pads (col, 0), (col, 1), ... to colors as one frame write.
+        
+        Args:
+            col: Column index
+            colors: One colour per row, starting at row 0
+            matrix_rows: The matrix button rows
+        """
+        self._begin_led_frame()
+        try:
+            self._pad_led_writes += 1
+            frame = self._pad_led_frame
+            for row, color_value in enumerate(colors):
+                frame[(col, row)] = color_value
+        finally:
+            self._end_led_frame(matrix_rows)
+    
+    def _reset_led_shadow(self):
+        """Forget last sent pad colours (e.g. after Session drew the grid) so every pad is resent."""
+        self._pad_led_shadow = {}
+        self._pad_led_deferred = {}
+        self._pad_led_writes += 1
+    
     def _clear_all_leds(self, matrix_rows):
         """
         Turn off all matrix pad LEDs.
@@ -428,13 +606,13 @@ class SequencerBase(object):
     
     # ==================== LOGGING HELPERS ====================
     
-    def _log_info(self, message):
-        """Log an info message."""
+    def _log_info(self, message, *args):
+        """Log an info message (%-formatted with args only when it is written)."""
         try:
             if self._logger:
-                self._logger.log_info(message)
+                self._logger.log_info(message, *args)
             else:
-                self._cs.log_message("[INFO] " + str(message))
+                self._cs.log_message("[INFO] " + (message % args if args else str(message)))
         except Exception:
             pass
     
@@ -95,13 +95,14 @@ class SequencerLogger(object):
         except Exception:
             pass
     
-    def log(self, category, message):
+    def log(self, category, message, *args):
         """
         Log a message if the category is enabled.
         
         Args:
             category (str): One of CATEGORIES keys
             message (str): Message to log
+            *args: Optional %-format arguments, applied only if the message is written
         """
         if not self._enabled:
             return
@@ -116,6 +117,9 @@ class SequencerLogger(object):
         if not force_log and (category not in self.CATEGORIES or not self.CATEGORIES[category]):
             return
         
+        if args:
+            message = message % args
+        
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
         formatted_message = "[%s] [%s] %s" % (timestamp, category, message)
         
@@ -201,11 +205,12 @@ class SequencerLogger(object):
         error_msg = "%s: %s" % (context, str(exception))
         self.log('ERRORS', error_msg)
     
-    def log_info(self, message):
+    def log_info(self, message, *args):
         """
         Log a general info message.
         
         Args:
             message (str): Message to log
+            *args: Optional %-format arguments, applied only if the message is written
         """
-        self.log('GENERAL', message)
+        self.log('GENERAL', message, *args)
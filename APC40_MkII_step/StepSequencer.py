@@ -198,18 +198,15 @@ class StepSequencer(object):
                         self._logger.log_info("Mode: Melodic Instrument (empty MIDI clip)")
                         return self._instrument_sequencer
                     
-                    pitches = set()
-                    velocities = set()
-                    start_times = set()
-                    
-                    for note in notes:
-                        pitch = note.pitch if hasattr(note, 'pitch') else note[0]
-                        velocity = note.velocity if hasattr(note, 'velocity') else note[3]
-                        start = note.start_time if hasattr(note, 'start_time') else note[1]
-                        
-                        pitches.add(pitch)
-                        velocities.add(velocity)
-                        start_times.add(start)
+                    # A clip returns one kind of note: pick attribute or index access once
+                    if hasattr(notes[0], 'pitch'):
+                        pitches = {note.pitch for note in notes}
+                        velocities = {note.velocity for note in notes}
+                        start_times = {note.start_time for note in notes}
+                    else:
+                        pitches = {note[0] for note in notes}
+                        velocities = {note[3] for note in notes}
+                        start_times = {note[1] for note in notes}
                     
                     pitch_range = max(pitches) - min(pitches)
                     
@@ -228,11 +225,8 @@ class StepSequencer(object):
                         self._logger.log_info("Piano roll detected: varied velocities (%d unique)" % len(velocities))
                     
                     # Check for melodic patterns (notes not on strict grid)
-                    grid_divisions = set()
-                    for start in start_times:
-                        # Quantize to 1/16th notes
-                        grid_pos = round(start * 4) / 4
-                        grid_divisions.add(grid_pos)
+                    # Quantize to 1/16th notes
+                    grid_divisions = {round(start * 4) / 4 for start in start_times}
                     
                     if len(grid_divisions) > 8:  # Many unique positions suggests melodic
                         is_piano_roll = True
@@ -284,7 +278,9 @@ class StepSequencer(object):
             self._active_sequencer = self._detect_sequencer_mode()
             if self._active_sequencer:
                 self._active_sequencer.enter()
-                self._active_sequencer.refresh_grid(self._matrix_rows_raw)
+                # Session owned the pads until now, so nothing in the shadow can be trusted
+                self._active_sequencer._reset_led_shadow()
+                self._refresh_grid()
                 if isinstance(self._active_sequencer, ClipSequencer) and self._active_sequencer.is_audio_mode():
                     bank_active = getattr(self._active_sequencer, '_bank_mode', False)
                     self._active_sequencer.render_view_leds(self._track_select_buttons, bank_active)
@@ -1041,6 +1037,9 @@ class StepSequencer(object):
 
     def _update_loop_leds(self):
         try:
+            # These writes replace the drum playhead's page colours on the same buttons
+            if self._active_sequencer is not None and hasattr(self._active_sequencer, '_forget_clip_stop_leds'):
+                self._active_sequencer._forget_clip_stop_leds()
             active_mask = self._loop_bitmask_shift if self._shift_is_pressed else self._loop_bitmask
             for i, btn in enumerate(self._clip_stop_buttons_raw):
                 if not btn:
@@ -1299,41 +1298,48 @@ class StepSequencer(object):
                     if not micro or (self._micro_tick_ctr % 4 == 0):
                         self._active_sequencer.update_scene_preview(self._scene_launch_buttons_raw)
 
-                # Advance any registered grid blink patterns
-                if not micro or (self._micro_tick_ctr % 2 == 0):
-                    try:
-                        self._active_sequencer.advance_grid_blink(self._matrix_rows_raw)
-                        self._logger.log('TIMING', "Grid blink advanced for active sequencer")
-                    except Exception as blink_exc:
-                        self._logger.log_error("_on_tick(advance_grid_blink)", blink_exc)
-
-                # Update playhead visualization for drum mode (always)
-                if isinstance(self._active_sequencer, DrumSequencer):
-                    try:
-                        # Force update playhead and clip stop buttons on every tick
-                        # regardless of micro timing
-                        self._active_sequencer.update_playhead_leds(
-                            self._matrix_rows_raw,
-                            self._clip_stop_buttons_raw
-                        )
-                        # Log playhead update for debugging
-                        self._logger.log('PLAYHEAD', 'Updated playhead and clip stop LEDs')
-                    except Exception as exc:
-                        self._logger.log_error("_on_tick(update_playhead)", exc)
-                    
-                    # Update boundary warning animation (blinks RED on boundaries)
-                    if self._active_sequencer._boundary_warning_active and (not micro or (self._micro_tick_ctr % 4 == 0)):
+                # Collect this tick's pad writes into one LED frame; only changed pads are sent
+                seq = self._active_sequencer
+                seq._begin_led_frame()
+                try:
+                    # Advance any registered grid blink patterns
+                    if not micro or (self._micro_tick_ctr % 2 == 0):
                         try:
-                            self._active_sequencer._draw_boundary_warning(self._matrix_rows_raw)
-                        except Exception as exc:
-                            self._logger.log_error("_on_tick(boundary_warning)", exc)
+                            self._active_sequencer.advance_grid_blink(self._matrix_rows_raw)
+                            self._logger.log('TIMING', "Grid blink advanced for active sequencer")
+                        except Exception as blink_exc:
+                            self._logger.log_error("_on_tick(advance_grid_blink)", blink_exc)
 
-                    # Re-assert static boundary bars so they persist during ticks
-                    if not micro or (self._micro_tick_ctr % 4 == 0):
+                    # Update playhead visualization for drum mode (always)
+                    if isinstance(self._active_sequencer, DrumSequencer):
                         try:
-                            self._active_sequencer._draw_static_boundaries(self._matrix_rows_raw)
+                            # Force update playhead and clip stop buttons on every tick
+                            # regardless of micro timing
+                            self._active_sequencer.update_playhead_leds(
+                                self._matrix_rows_raw,
+                                self._clip_stop_buttons_raw
+                            )
+                            # Log playhead update for debugging
+                            self._logger.log('PLAYHEAD', 'Updated playhead and clip stop LEDs')
                         except Exception as exc:
-                            self._logger.log_error("_on_tick(draw_static_boundaries)", exc)
+                            self._logger.log_error("_on_tick(update_playhead)", exc)
+                    
+                        # Update boundary warning animation (blinks RED on boundaries)
+                        if self._active_sequencer._boundary_warning_active and (not micro or (self._micro_tick_ctr % 4 == 0)):
+                            try:
+                                self._active_sequencer._draw_boundary_warning(self._matrix_rows_raw)
+                            except Exception as exc:
+                                self._logger.log_error("_on_tick(boundary_warning)", exc)
+
+                        # Re-assert static boundary bars so they persist during ticks
+                        if not micro or (self._micro_tick_ctr % 4 == 0):
+                            try:
+                                self._active_sequencer._draw_static_boundaries(self._matrix_rows_raw)
+                            except Exception as exc:
+                                self._logger.log_error("_on_tick(draw_static_boundaries)", exc)
+                finally:
+                    with self._cs.accumulating_midi_messages():
+                        seq._end_led_frame(self._matrix_rows_raw, 'TIMING', seq._TICK_LED_BUDGET)
             
             # Schedule next tick
             self._schedule_tick()
@@ -1351,10 +1357,17 @@ class StepSequencer(object):
             self._logger.log_error("_clear_all_leds", e)
     
     def _refresh_grid(self):
-        """Refresh the grid display."""
+        """Refresh the grid display, sending only pads whose colour changed."""
         try:
-            if self._active_sequencer:
-                self._active_sequencer.refresh_grid(self._matrix_rows_raw)
+            seq = self._active_sequencer
+            if seq:
+                seq._begin_led_frame()
+                try:
+                    seq.refresh_grid(self._matrix_rows_raw)
+                finally:
+                    # The surface queues the frame's note-ons and writes them out in one burst
+                    with self._cs.accumulating_midi_messages():
+                        seq._end_led_frame(self._matrix_rows_raw)
         except Exception as e:
             self._logger.log_error("_refresh_grid", e)
     